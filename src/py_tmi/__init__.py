@@ -1,5 +1,16 @@
 """Python port of the tmi.js Twitch Messaging Interface."""
 
+import asyncio
+import os
+
+if os.environ.get("PY_TMI_USE_UVLOOP") == "1":
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 from .client import Client
 from .client_base import ClientBase
 from .options import ClientOptions, ConnectionOptions, IdentityOptions, LoggingOptions
@@ -1,41 +1,86 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Dict, Iterable, Optional, Tuple
 
-from .client_base import ClientBase
+from .client_base import PING_WIRE, WHISPER_EVENTS, ClientBase
 from .exceptions import AnonymousMessageError, CommandFailed, CommandTimedOut
 from . import utils
 
+_COMMAND_PREFIXES = frozenset((".", "/", "\\"))
+
+_ANNOUNCE_FMT = "/announce {}".format
+_BAN_FMT = "/ban {}".format
+_BAN_REASON_FMT = "/ban {} {}".format
+_COLOR_FMT = "/color {}".format
+_COMMERCIAL_FMT = "/commercial {}".format
+_DELETE_FMT = "/delete {}".format
+_FOLLOWERS_FMT = "/followers {}".format
+_HOST_FMT = "/host {}".format
+_MOD_FMT = "/mod {}".format
+_SLOW_FMT = "/slow {}".format
+_TIMEOUT_FMT = "/timeout {} {}".format
+_TIMEOUT_REASON_FMT = "/timeout {} {} {}".format
+_UNBAN_FMT = "/unban {}".format
+_UNMOD_FMT = "/unmod {}".format
+_UNVIP_FMT = "/unvip {}".format
+_VIP_FMT = "/vip {}".format
+_WHISPER_FMT = "/w {} {}".format
+
+# (method name, command, promise event); a ``None`` promise sends without awaiting an ack.
+_SIMPLE_COMMANDS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ("clear", "/clear", "_promiseClear"),
+    ("emoteonly", "/emoteonly", "_promiseEmoteonly"),
+    ("emoteonlyoff", "/emoteonlyoff", None),
+    ("followersonlyoff", "/followersoff", None),
+    ("r9kbeta", "/r9kbeta", "_promiseR9kbeta"),
+    ("r9kbetaoff", "/r9kbetaoff", None),
+    ("slowoff", "/slowoff", None),
+    ("subscribers", "/subscribers", "_promiseSubscribers"),
+    ("subscribersoff", "/subscribersoff", None),
+    ("unhost", "/unhost", None),
+)
+
 
 class Client(ClientBase):
     """High-level Twitch chat client mirroring the tmi.js commands API."""
 
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        # Generated from _SIMPLE_COMMANDS below.
+        clear: Callable[[str], Awaitable[Tuple[str]]]
+        emoteonly: Callable[[str], Awaitable[Tuple[str]]]
+        emoteonlyoff: Callable[[str], Awaitable[Tuple[str]]]
+        followersonlyoff: Callable[[str], Awaitable[Tuple[str]]]
+        r9kbeta: Callable[[str], Awaitable[Tuple[str]]]
+        r9kbetaoff: Callable[[str], Awaitable[Tuple[str]]]
+        slowoff: Callable[[str], Awaitable[Tuple[str]]]
+        subscribers: Callable[[str], Awaitable[Tuple[str]]]
+        subscribersoff: Callable[[str], Awaitable[Tuple[str]]]
+        unhost: Callable[[str], Awaitable[Tuple[str]]]
+
     async def action(self, channel: str, message: str, tags: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+        channel_name = utils.channel(channel)
         formatted = f"\u0001ACTION {message}\u0001"
-        await super().say(channel, formatted, tags)
-        return utils.channel(channel), message
+        await super().say(channel_name, formatted, tags)
+        return channel_name, message
 
     async def announce(self, channel: str, message: str) -> Tuple[str, str]:
         channel_name = utils.channel(channel)
-        await self._send_command(channel_name, f"/announce {message}")
+        await self._send_command(channel_name, _ANNOUNCE_FMT(message))
         return channel_name, message
 
     async def ban(self, channel: str, username: str, reason: Optional[str] = None) -> Tuple[str, str, str]:
+        channel_name = utils.channel(channel)
         username = utils.username(username)
         reason = reason or ""
-        command = f"/ban {username} {reason}".strip()
-        await self._send_command(utils.channel(channel), command)
+        command = _BAN_REASON_FMT(username, reason) if reason else _BAN_FMT(username)
+        await self._send_command(channel_name, command)
         await self._await_success("_promiseBan", command)
-        return utils.channel(channel), username, reason
-
-    async def clear(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/clear")
-        await self._await_success("_promiseClear", "/clear")
-        return (channel_name,)
+        return channel_name, username, reason
 
     async def color(self, color: str) -> Tuple[str]:
-        command = f"/color {color}"
+        command = _COLOR_FMT(color)
         await self._send_command(self._global_default_channel, command)
         await self._await_success("_promiseColor", command)
         return (color,)
@@ -43,46 +88,29 @@ class Client(ClientBase):
     async def commercial(self, channel: str, seconds: int = 30) -> Tuple[str, int]:
         channel_name = utils.channel(channel)
         seconds = int(seconds)
-        command = f"/commercial {seconds}"
+        command = _COMMERCIAL_FMT(seconds)
         await self._send_command(channel_name, command)
         await self._await_success("_promiseCommercial", command)
         return channel_name, seconds
 
     async def deletemessage(self, channel: str, message_uuid: str) -> Tuple[str]:
         channel_name = utils.channel(channel)
-        await self._send_command(channel_name, f"/delete {message_uuid}")
+        await self._send_command(channel_name, _DELETE_FMT(message_uuid))
         await self._await_success("_promiseDeletemessage", "/delete")
         return (channel_name,)
 
-    async def emoteonly(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/emoteonly")
-        await self._await_success("_promiseEmoteonly", "/emoteonly")
-        return (channel_name,)
-
-    async def emoteonlyoff(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/emoteonlyoff")
-        await self._await_success("_promiseEmoteonlyoff", "/emoteonlyoff")
-        return (channel_name,)
-
     async def followersonly(self, channel: str, minutes: int = 30) -> Tuple[str, int]:
         channel_name = utils.channel(channel)
-        command = f"/followers {int(minutes)}"
+        minutes = int(minutes)
+        command = _FOLLOWERS_FMT(minutes)
         await self._send_command(channel_name, command)
         await self._await_success("_promiseFollowers", command)
-        return channel_name, int(minutes)
-
-    async def followersonlyoff(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/followersoff")
-        await self._await_success("_promiseFollowersoff", "/followersoff")
-        return (channel_name,)
+        return channel_name, minutes
 
     async def host(self, channel: str, target: str) -> Tuple[str, str, int]:
         channel_name = utils.channel(channel)
         target_name = utils.username(target)
-        command = f"/host {target_name}"
+        command = _HOST_FMT(target_name)
         await self._send_command(channel_name, command)
         _, remaining = await self._await_success("_promiseHost", command)
         return channel_name, target_name, int(remaining or 0)
@@ -90,18 +118,17 @@ class Client(ClientBase):
     async def join(self, channel: str) -> Tuple[str]:
         channel_name, = await super().join(channel)
 
-        def predicate(args: Tuple[object, ...]) -> bool:
-            return len(args) > 1 and utils.channel(args[1]) == channel_name
+        # _promiseJoin is emitted with an already normalized channel, so compare it directly.
+        def predicate(args: Tuple[object, ...], _channel_name: str = channel_name) -> bool:
+            return len(args) > 1 and args[1] == _channel_name
 
-        result = await self._await_success("_promiseJoin", f"JOIN {channel_name}", predicate=predicate)
-        if result and len(result) > 1:
-            return (utils.channel(result[1]),)
+        await self._await_success("_promiseJoin", f"JOIN {channel_name}", predicate=predicate)
         return (channel_name,)
 
     async def mod(self, channel: str, username: str) -> Tuple[str, str]:
         channel_name = utils.channel(channel)
         username = utils.username(username)
-        await self._send_command(channel_name, f"/mod {username}")
+        await self._send_command(channel_name, _MOD_FMT(username))
         await self._await_success("_promiseMod", "/mod")
         return channel_name, username
 
@@ -110,10 +137,7 @@ class Client(ClientBase):
         await self._send_command(channel_name, "/mods")
         _, mods = await self._await_success("_promiseMods", "/mods")
         if mods:
-            for name in mods:
-                mod_list = self.moderators.setdefault(channel_name, [])
-                if name not in mod_list:
-                    mod_list.append(name)
+            self.moderators.setdefault(channel_name, set()).update(mods)
         return mods or []
 
     async def part(self, channel: str) -> Tuple[str]:
@@ -124,108 +148,82 @@ class Client(ClientBase):
 
     async def ping(self) -> float:
         self._latency_start = self.loop.time()
-        await self._send_raw("PING")
+        await self._write_wire(PING_WIRE)
         latency, = await self.wait_for("_promisePing")
         return float(latency)
 
-    async def r9kbeta(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/r9kbeta")
-        await self._await_success("_promiseR9kbeta", "/r9kbeta")
-        return (channel_name,)
-
-    async def r9kbetaoff(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/r9kbetaoff")
-        await self._await_success("_promiseR9kbetaoff", "/r9kbetaoff")
-        return (channel_name,)
-
     async def raw(self, command: str, tags: Optional[Dict[str, str]] = None) -> Tuple[str]:
         await self._send_command(None, command, tags=tags)
         return (command,)
 
     async def reply(self, channel: str, message: str, reply_parent_msg_id, tags: Optional[Dict[str, str]] = None):
-        tags = dict(tags or {})
-        if isinstance(reply_parent_msg_id, dict):
-            reply_parent_msg_id = reply_parent_msg_id.get("id")
-        if not reply_parent_msg_id or not isinstance(reply_parent_msg_id, str):
+        if type(reply_parent_msg_id) is not str:
+            if isinstance(reply_parent_msg_id, dict):
+                reply_parent_msg_id = reply_parent_msg_id.get("id")
+            if not isinstance(reply_parent_msg_id, str):
+                raise ValueError("replyParentMsgId is required.")
+        if not reply_parent_msg_id:
             raise ValueError("replyParentMsgId is required.")
-        tags["reply-parent-msg-id"] = reply_parent_msg_id
+        if tags:
+            tags = {**tags, "reply-parent-msg-id": reply_parent_msg_id}
+        else:
+            tags = {"reply-parent-msg-id": reply_parent_msg_id}
         return await self.say(channel, message, tags)
 
     async def say(self, channel: str, message: str, tags: Optional[Dict[str, str]] = None):
+        if message[:1] not in _COMMAND_PREFIXES or message.startswith(".."):
+            return await super().say(channel, message, tags)
         channel_name = utils.channel(channel)
-        if (message.startswith(".") and not message.startswith("..")) or message.startswith("/") or message.startswith("\\"):
-            if message[1:4] == "me ":
-                return await self.action(channel_name, message[4:], tags)
-            await self._send_command(channel_name, message, tags=tags or {})
-            return channel_name, message
-        return await super().say(channel_name, message, tags)
+        if message[1:4] == "me ":
+            return await self.action(channel_name, message[4:], tags)
+        await self._send_command(channel_name, message, tags=tags or {})
+        return channel_name, message
 
     async def slow(self, channel: str, seconds: int = 300) -> Tuple[str, int]:
         channel_name = utils.channel(channel)
         seconds = int(seconds)
-        await self._send_command(channel_name, f"/slow {seconds}")
+        await self._send_command(channel_name, _SLOW_FMT(seconds))
         await self._await_success("_promiseSlow", "/slow")
         return channel_name, seconds
 
-    async def slowoff(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/slowoff")
-        await self._await_success("_promiseSlowoff", "/slowoff")
-        return (channel_name,)
-
-    async def subscribers(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/subscribers")
-        await self._await_success("_promiseSubscribers", "/subscribers")
-        return (channel_name,)
-
-    async def subscribersoff(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/subscribersoff")
-        await self._await_success("_promiseSubscribersoff", "/subscribersoff")
-        return (channel_name,)
-
     async def timeout(self, channel: str, username: str, seconds: int = 300, reason: Optional[str] = None) -> Tuple[str, str, int, str]:
         channel_name = utils.channel(channel)
         username = utils.username(username)
+        seconds = int(seconds)
         reason = reason or ""
-        await self._send_command(channel_name, f"/timeout {username} {int(seconds)} {reason}".strip())
+        if reason:
+            command = _TIMEOUT_REASON_FMT(username, seconds, reason)
+        else:
+            command = _TIMEOUT_FMT(username, seconds)
+        await self._send_command(channel_name, command)
         await self._await_success("_promiseTimeout", "/timeout")
-        return channel_name, username, int(seconds), reason
+        return channel_name, username, seconds, reason
 
     async def unban(self, channel: str, username: str) -> Tuple[str, str]:
         channel_name = utils.channel(channel)
         username = utils.username(username)
-        await self._send_command(channel_name, f"/unban {username}")
+        await self._send_command(channel_name, _UNBAN_FMT(username))
         await self._await_success("_promiseUnban", "/unban")
         return channel_name, username
 
-    async def unhost(self, channel: str) -> Tuple[str]:
-        channel_name = utils.channel(channel)
-        await self._send_command(channel_name, "/unhost")
-        await self._await_success("_promiseUnhost", "/unhost")
-        return (channel_name,)
-
     async def unmod(self, channel: str, username: str) -> Tuple[str, str]:
         channel_name = utils.channel(channel)
         username = utils.username(username)
-        await self._send_command(channel_name, f"/unmod {username}")
+        await self._send_command(channel_name, _UNMOD_FMT(username))
         await self._await_success("_promiseUnmod", "/unmod")
         return channel_name, username
 
     async def unvip(self, channel: str, username: str) -> Tuple[str, str]:
         channel_name = utils.channel(channel)
         username = utils.username(username)
-        await self._send_command(channel_name, f"/unvip {username}")
+        await self._send_command(channel_name, _UNVIP_FMT(username))
         await self._await_success("_promiseUnvip", "/unvip")
         return channel_name, username
 
     async def vip(self, channel: str, username: str) -> Tuple[str, str]:
         channel_name = utils.channel(channel)
         username = utils.username(username)
-        await self._send_command(channel_name, f"/vip {username}")
+        await self._send_command(channel_name, _VIP_FMT(username))
         await self._await_success("_promiseVip", "/vip")
         return channel_name, username
 
@@ -237,9 +235,10 @@ class Client(ClientBase):
 
     async def whisper(self, username: str, message: str) -> Tuple[str, str]:
         username = utils.username(username)
-        if username == self.get_username():
+        me = self.get_username()
+        if username == me:
             raise AnonymousMessageError("Cannot send a whisper to the same account.")
-        command = f"/w {username} {message}"
+        command = _WHISPER_FMT(username, message)
         await self._send_command(self._global_default_channel, command)
         try:
             result = await self.wait_for("_promiseWhisper", timeout=5.0)
@@ -248,18 +247,19 @@ class Client(ClientBase):
         except CommandTimedOut:
             pass
         whisper_channel = utils.channel(username)
-        userstate = dict(self.globaluserstate)
-        userstate.update(
-            {
-                "message-type": "whisper",
-                "message-id": None,
-                "thread-id": None,
-                "username": self.get_username(),
-            }
-        )
-        self.emit_many(["whisper", "message"], [(whisper_channel, userstate, message, True)])
+        version, template = self._whisper_template
+        if version != self._gus_version:
+            template = {**self.globaluserstate, "message-type": "whisper", "message-id": None, "thread-id": None}
+            self._whisper_template = (self._gus_version, template)
+        userstate = dict(template)
+        userstate["username"] = me
+        self.emit_fanout(WHISPER_EVENTS, whisper_channel, userstate, message, True)
         return username, message
 
+    async def _send_fire(self, channel: str, command: str) -> None:
+        """Send a command whose acknowledgement carries no data without waiting for it."""
+        await self._send_command(channel, command)
+
     async def _await_success(
         self,
         event: str,
@@ -276,6 +276,33 @@ class Client(ClientBase):
         return result
 
 
+def _make_simple(
+    name: str, command: str, promise: Optional[str]
+) -> Callable[..., Coroutine[Any, Any, Tuple[str]]]:
+    if promise is None:
+
+        async def simple(self: Client, channel: str) -> Tuple[str]:
+            channel_name = utils.channel(channel)
+            await self._send_fire(channel_name, command)
+            return (channel_name,)
+
+    else:
+
+        async def simple(self: Client, channel: str) -> Tuple[str]:
+            channel_name = utils.channel(channel)
+            await self._send_command(channel_name, command)
+            await self._await_success(promise, command)
+            return (channel_name,)
+
+    simple.__name__ = name
+    simple.__qualname__ = f"Client.{name}"
+    simple.__doc__ = f"Send ``{command}`` to ``channel``."
+    return simple
+
+
+for _name, _command, _promise in _SIMPLE_COMMANDS:
+    setattr(Client, _name, _make_simple(_name, _command, _promise))
+
 Client.followersmode = Client.followersonly  # type: ignore[attr-defined]
 Client.followersmodeoff = Client.followersonlyoff  # type: ignore[attr-defined]
 Client.leave = Client.part  # type: ignore[attr-defined]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import ssl
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from .event_emitter import EventEmitter
 from .exceptions import AnonymousMessageError, AuthenticationError, CommandTimedOut, ConnectionError, NotConnectedError
@@ -17,17 +19,353 @@ DEFAULT_HOST = "irc.chat.twitch.tv"
 DEFAULT_PORT = 6697
 PING_PAYLOAD = "PING :tmi.twitch.tv"
 PONG_PAYLOAD = "PONG :tmi.twitch.tv"
+PING_WIRE = f"{PING_PAYLOAD}\r\n".encode("utf-8")
+PONG_WIRE = f"{PONG_PAYLOAD}\r\n".encode("utf-8")
 PRIVMSG_LIMIT = 500
+SEND_BUFFER_LIMIT = 16 * 1024
+RECV_BUFFER_SIZE = 64 * 1024
+WHISPER_EVENTS = ("whisper", "message")
+ACTION_EVENTS = ("action", "message")
+CHAT_EVENTS = ("chat", "message")
+SLOW_OFF_EVENTS = ("slow", "slowmode", "_promiseSlowoff")
+SLOW_ON_EVENTS = ("slow", "slowmode", "_promiseSlow")
+FOLLOWERS_OFF_EVENTS = ("followersonly", "followersmode", "_promiseFollowersoff")
+FOLLOWERS_ON_EVENTS = ("followersonly", "followersmode", "_promiseFollowers")
+# First whitespace-delimited integer token of a jtv "hosting you for N viewers" message.
+_HOST_COUNT_RE = re.compile(r"(?<!\S)([+-]?\d+)(?!\S)")
+_DIGITS_RE = re.compile(r"\d+")
+# Free-text NOTICEs (no msg-id) that mean authentication failed; scanned in a single pass.
+_AUTH_FAILURE_RE = re.compile(
+    "Login unsuccessful|Login authentication failed|Error logging in|Improperly formatted auth|Invalid NICK"
+)
+# Tags passed through without flag conversion or unescaping.
+_RAW_TAGS = frozenset(("emote-sets", "ban-duration", "bits"))
+
+COMMAND_WIRE: Dict[str, bytes] = {
+    command: f"{command}\r\n".encode("utf-8")
+    for command in (
+        "/clear",
+        "/emoteonly",
+        "/emoteonlyoff",
+        "/followersoff",
+        "/mods",
+        "/r9kbeta",
+        "/r9kbetaoff",
+        "/slowoff",
+        "/subscribers",
+        "/subscribersoff",
+        "/unhost",
+        "/vips",
+    )
+}
+
+# NOTICE msg-ids that resolve a pending command: emitted as ``notice`` plus the command's
+# promise event, settled with ``None`` on success or with the msg-id on failure.
+_NOTICE_SUCCESS: Dict[str, str] = {
+    "ban_success": "_promiseBan",
+    "color_changed": "_promiseColor",
+    "commercial_success": "_promiseCommercial",
+    "delete_message_success": "_promiseDeletemessage",
+    "mod_success": "_promiseMod",
+    "timeout_success": "_promiseTimeout",
+    "unban_success": "_promiseUnban",
+    "unmod_success": "_promiseUnmod",
+    "untimeout_success": "_promiseUnban",
+    "unvip_success": "_promiseUnvip",
+    "vip_success": "_promiseVip",
+}
+
+_NOTICE_FAILURE: Dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "already_banned",
+            "bad_ban_admin",
+            "bad_ban_anon",
+            "bad_ban_broadcaster",
+            "bad_ban_global_mod",
+            "bad_ban_mod",
+            "bad_ban_self",
+            "bad_ban_staff",
+            "usage_ban",
+        ),
+        "_promiseBan",
+    ),
+    "usage_clear": "_promiseClear",
+    **dict.fromkeys(("usage_color", "turbo_only_color"), "_promiseColor"),
+    **dict.fromkeys(("usage_commercial", "bad_commercial_error"), "_promiseCommercial"),
+    **dict.fromkeys(
+        ("usage_delete", "bad_delete_message_error", "bad_delete_message_broadcaster", "bad_delete_message_mod"),
+        "_promiseDeletemessage",
+    ),
+    **dict.fromkeys(("already_emote_only_off", "usage_emote_only_off", "already_emote_only_on", "usage_emote_only_on"), "_promiseEmoteonly"),
+    **dict.fromkeys(("bad_host_hosting", "bad_host_rate_exceeded", "bad_host_error", "usage_host"), "_promiseHost"),
+    **dict.fromkeys(("usage_mod", "bad_mod_banned", "bad_mod_mod"), "_promiseMod"),
+    **dict.fromkeys(("already_r9k_on", "usage_r9k_on"), "_promiseR9kbeta"),
+    **dict.fromkeys(("already_r9k_off", "usage_r9k_off"), "_promiseR9kbetaoff"),
+    "usage_slow_on": "_promiseSlow",
+    "usage_slow_off": "_promiseSlowoff",
+    **dict.fromkeys(("already_subs_off", "usage_subs_off", "already_subs_on", "usage_subs_on"), "_promiseSubscribers"),
+    **dict.fromkeys(
+        (
+            "usage_timeout",
+            "bad_timeout_admin",
+            "bad_timeout_anon",
+            "bad_timeout_broadcaster",
+            "bad_timeout_duration",
+            "bad_timeout_global_mod",
+            "bad_timeout_mod",
+            "bad_timeout_self",
+            "bad_timeout_staff",
+        ),
+        "_promiseTimeout",
+    ),
+    **dict.fromkeys(("usage_unban", "bad_unban_no_ban"), "_promiseUnban"),
+    **dict.fromkeys(("usage_unhost", "not_hosting"), "_promiseUnhost"),
+    **dict.fromkeys(("usage_unmod", "bad_unmod_mod"), "_promiseUnmod"),
+    **dict.fromkeys(("usage_unvip", "bad_unvip_grantee_not_vip"), "_promiseUnvip"),
+    **dict.fromkeys(
+        ("usage_vip", "bad_vip_grantee_banned", "bad_vip_grantee_already_vip", "bad_vip_max_vips_reached", "bad_vip_achievement_incomplete"),
+        "_promiseVip",
+    ),
+    **dict.fromkeys(
+        (
+            "whisper_invalid_login",
+            "whisper_invalid_self",
+            "whisper_limit_per_min",
+            "whisper_limit_per_sec",
+            "whisper_restricted",
+            "whisper_restricted_recipient",
+        ),
+        "_promiseWhisper",
+    ),
+}
+
+_NOTICE_PROMISES: Dict[str, Tuple[str, Tuple[Optional[str]]]] = {
+    **{msgid: (promise, (None,)) for msgid, promise in _NOTICE_SUCCESS.items()},
+    **{msgid: (promise, (msgid,)) for msgid, promise in _NOTICE_FAILURE.items()},
+}
+
+# Pending command promises failed by account/channel-level rejections (no_permission, msg_banned, ...).
+_REJECTED_PROMISES: Tuple[str, ...] = (
+    "_promiseBan",
+    "_promiseClear",
+    "_promiseUnban",
+    "_promiseTimeout",
+    "_promiseDeletemessage",
+    "_promiseMods",
+    "_promiseMod",
+    "_promiseUnmod",
+    "_promiseVips",
+    "_promiseVip",
+    "_promiseUnvip",
+    "_promiseCommercial",
+    "_promiseHost",
+    "_promiseUnhost",
+    "_promiseJoin",
+    "_promisePart",
+    "_promiseR9kbeta",
+    "_promiseR9kbetaoff",
+    "_promiseSlow",
+    "_promiseSlowoff",
+    "_promiseFollowers",
+    "_promiseFollowersoff",
+    "_promiseSubscribers",
+    "_promiseSubscribersoff",
+    "_promiseEmoteonly",
+    "_promiseEmoteonlyoff",
+    "_promiseWhisper",
+)
+
+# Room mode NOTICEs: log text, public events emitted with ``(channel, enabled)``, promise event.
+_NOTICE_MODES: Dict[str, Tuple[str, Tuple[str, ...], str, bool]] = {
+    "subs_on": ("This room is now in subscribers-only mode.", ("subscriber", "subscribers"), "_promiseSubscribers", True),
+    "subs_off": ("This room is no longer in subscribers-only mode.", ("subscriber", "subscribers"), "_promiseSubscribersoff", False),
+    "emote_only_on": ("This room is now in emote-only mode.", ("emoteonly",), "_promiseEmoteonly", True),
+    "emote_only_off": ("This room is no longer in emote-only mode.", ("emoteonly",), "_promiseEmoteonlyoff", False),
+    "r9k_on": ("This room is now in r9k mode.", ("r9kmode", "r9kbeta"), "_promiseR9kbeta", True),
+    "r9k_off": ("This room is no longer in r9k mode.", ("r9kmode", "r9kbeta"), "_promiseR9kbetaoff", False),
+}
+
+@lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """Default TLS context, created once so reconnects don't reload the CA store."""
+    return ssl.create_default_context()
+
+
+def _sub_methods(tags: Dict[str, Any]) -> Dict[str, Any]:
+    """Sub plan details shared by the subscription USERNOTICE events."""
+    plan = tags.get("msg-param-sub-plan", "")
+    plan_name_raw = tags.get("msg-param-sub-plan-name") or ""
+    return {
+        "prime": "Prime" in plan if isinstance(plan, str) else False,
+        "plan": plan,
+        "plan_name": utils.unescape_irc(plan_name_raw) if plan_name_raw else None,
+    }
+
+
+@lru_cache(maxsize=256)
+def _tag_int(value: Any) -> int:
+    # Durations and counts repeat a handful of values (timeout storms, gift bombs).
+    return int(value) if value else 0
+
+
+def _streak_months(tags: Dict[str, Any]) -> int:
+    return _tag_int(tags.get("msg-param-streak-months"))
+
+
+def _recipient(tags: Dict[str, Any]) -> Any:
+    return tags.get("msg-param-recipient-display-name") or tags.get("msg-param-recipient-user-name")
+
+
+def _gift_sub_count(tags: Dict[str, Any]) -> int:
+    return _tag_int(tags.get("msg-param-mass-gift-count"))
+
+
+class _IrcProtocol(asyncio.BufferedProtocol):
+    """Splits the incoming byte stream into lines using a reusable receive buffer.
+
+    Lines are queued without their ``\\r\\n`` terminator and empty lines are dropped,
+    so the reader only has to decode them.
+    """
+
+    def __init__(self, lines: "asyncio.Queue[Optional[bytes]]") -> None:
+        self.transport: Optional[asyncio.Transport] = None
+        self._lines = lines
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buf)
+        self._pending = 0
+        self._paused = False
+        self._connection_lost = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._pending == len(self._recv_buf):
+            # A single line filled the whole buffer; grow it so the line can complete.
+            self._recv_view.release()
+            self._recv_buf.extend(bytes(len(self._recv_buf)))
+            self._recv_view = memoryview(self._recv_buf)
+        return self._recv_view[self._pending :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        buf = self._recv_buf
+        end = self._pending + nbytes
+        start = 0
+        newline = buf.find(b"\n", start, end)
+        while newline != -1:
+            stop = newline - 1 if newline > start and buf[newline - 1] == 13 else newline
+            if stop > start:
+                self._lines.put_nowait(bytes(self._recv_view[start:stop]))
+            start = newline + 1
+            newline = buf.find(b"\n", start, end)
+        remaining = end - start
+        if remaining and start:
+            buf[:remaining] = self._recv_view[start:end]
+        self._pending = remaining
+
+    def eof_received(self) -> bool:
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._connection_lost = True
+        self._lines.put_nowait(None)
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter and not waiter.done():
+            waiter.set_exception(ConnectionResetError("Connection lost"))
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+    async def drain(self) -> None:
+        if self._connection_lost:
+            raise ConnectionResetError("Connection lost")
+        if not self._paused:
+            return
+        if self._drain_waiter is None:
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+        await asyncio.shield(self._drain_waiter)
+
+    async def wait_closed(self) -> None:
+        await asyncio.shield(self._closed)
+
 
 class ClientBase(EventEmitter):
     """Core Twitch IRC client that mirrors the behaviour of ClientBase in tmi.js."""
 
+    __slots__ = (
+        "loop",
+        "options",
+        "_opts_channels",
+        "connection",
+        "identity",
+        "log",
+        "_messages_log_level",
+        "_msg_log",
+        "_transport",
+        "_protocol",
+        "_lines",
+        "_read_task",
+        "_ping_task",
+        "_reconnect_task",
+        "_user_handlers",
+        "_write_task",
+        "_disconnect_event",
+        "_send_buf",
+        "_flush_event",
+        "_flushed",
+        "_command_queue",
+        "_message_queue",
+        "_join_queue",
+        "server",
+        "port",
+        "client_id",
+        "username",
+        "globaluserstate",
+        "_gus_version",
+        "_whisper_template",
+        "userstate",
+        "_channels",
+        "last_joined",
+        "moderators",
+        "_skip_membership",
+        "_global_default_channel",
+        "reconnect",
+        "reconnections",
+        "max_reconnect_attempts",
+        "max_reconnect_interval",
+        "reconnect_interval",
+        "reconnect_decay",
+        "reconnecting",
+        "reconnect_timer",
+        "current_latency",
+        "_latency_start",
+        "was_close_called",
+        "reason",
+        "emotes",
+        "emotesets",
+    )
+
     def __init__(self, options: Optional[ClientOptions] = None, *, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
         super().__init__()
-        self.loop = loop or asyncio.get_event_loop()
         self.options = options or ClientOptions()
+        if loop is None and self.options.use_uvloop:
+            import uvloop
 
-        self.opts_channels = [utils.channel(ch) for ch in self.options.channels]
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        self.loop = loop or asyncio.get_event_loop()
+
+        self._opts_channels: Dict[str, None] = dict.fromkeys(utils.channel(ch) for ch in self.options.channels)
         self.connection: ConnectionOptions = self.options.connection
         self.identity: IdentityOptions = self.options.identity
 
@@ -35,11 +373,17 @@ class ClientBase(EventEmitter):
         self.log.set_level(self.options.logging.level)
         self.messages_log_level = self.options.logging.messages_level
 
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[_IrcProtocol] = None
+        self._lines: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
         self._read_task: Optional[asyncio.Task[None]] = None
         self._ping_task: Optional[asyncio.Task[None]] = None
+        self._reconnect_task: Optional[asyncio.Task[None]] = None
+        self._write_task: Optional[asyncio.Task[None]] = None
         self._disconnect_event = asyncio.Event()
+        self._send_buf = bytearray()
+        self._flush_event = asyncio.Event()
+        self._flushed: Optional[asyncio.Future] = None
 
         self._command_queue = MessageQueue(self.connection.command_rate_limit, loop=self.loop)
         self._message_queue = MessageQueue(self.connection.message_rate_limit, loop=self.loop)
@@ -51,10 +395,12 @@ class ClientBase(EventEmitter):
         self.client_id: Optional[str] = None
         self.username: str = ""
         self.globaluserstate: Dict[str, Any] = {}
+        self._gus_version = 0
+        self._whisper_template: Tuple[int, Dict[str, Any]] = (-1, {})
         self.userstate: Dict[str, Dict[str, Any]] = {}
-        self.channels: List[str] = []
-        self.last_joined: str = ""
-        self.moderators: Dict[str, List[str]] = {}
+        self._channels: Dict[str, None] = {}
+        self.last_joined: str = ""  # always stored normalized via utils.channel
+        self.moderators: Dict[str, Set[str]] = {}
         self._skip_membership = self.options.skip_membership
         self._global_default_channel = utils.channel(self.options.global_default_channel)
         self.reconnect = self.connection.reconnect
@@ -73,6 +419,24 @@ class ClientBase(EventEmitter):
         self.emotes = ""
         self.emotesets: Dict[str, Any] = {}
 
+        self._user_handlers: Dict[str, Callable[[IRCMessage], Awaitable[None]]] = {
+            "PRIVMSG": self._handle_privmsg,
+            "WHISPER": self._handle_whisper,
+            "NOTICE": self._handle_notice,
+            "USERNOTICE": self._handle_usernotice,
+            "CLEARCHAT": self._handle_clearchat,
+            "CLEARMSG": self._handle_clearmsg,
+            "ROOMSTATE": self._handle_roomstate,
+            "USERSTATE": self._handle_userstate,
+            "GLOBALUSERSTATE": self._handle_globaluserstate,
+            "RECONNECT": self._handle_reconnect,
+            "JOIN": self._handle_join,
+            "PART": self._handle_part,
+            "MODE": self._handle_mode,
+            "353": self._handle_names,
+            "366": self._handle_endofnames,
+        }
+
     # --------------------------------------------------------------------- #
     # Connection management
     # --------------------------------------------------------------------- #
@@ -89,7 +453,18 @@ class ClientBase(EventEmitter):
         return (self.server, self.port)
 
     async def disconnect(self) -> Tuple[str, int]:
-        if not self._writer:
+        reconnect_task = self._reconnect_task
+        if reconnect_task or self.reconnecting:
+            # The transport is None while the reconnect loop backs off, so stop the loop first.
+            self.was_close_called = True
+            if reconnect_task and reconnect_task is not asyncio.current_task():
+                reconnect_task.cancel()
+                await asyncio.gather(reconnect_task, return_exceptions=True)
+            if not self._transport:
+                self.log.info("Reconnect cancelled.")
+                return (self.server, self.port)
+
+        if not self._transport:
             raise NotConnectedError("Cannot disconnect: socket is not open.")
 
         self.was_close_called = True
@@ -100,17 +475,18 @@ class ClientBase(EventEmitter):
 
     async def _establish_connection(self) -> None:
         try:
-            ssl_context: Optional[ssl.SSLContext] = None
-            if self.connection.secure:
-                ssl_context = ssl.create_default_context()
+            ssl_context = _ssl_context() if self.connection.secure else None
 
-            self._reader, self._writer = await asyncio.open_connection(
-                self.server, self.port, ssl=ssl_context
+            lines: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+            self._transport, self._protocol = await self.loop.create_connection(
+                lambda: _IrcProtocol(lines), self.server, self.port, ssl=ssl_context
             )
+            self._lines = lines
         except Exception as exc:  # pragma: no cover - network errors are environment-specific
             raise ConnectionError(f"Failed to connect to {self.server}:{self.port}") from exc
 
         self._read_task = self.loop.create_task(self._reader_loop())
+        self._write_task = self.loop.create_task(self._writer_loop())
         self._ping_task = self.loop.create_task(self._ping_loop())
 
         await self._authenticate()
@@ -124,9 +500,8 @@ class ClientBase(EventEmitter):
         password = utils.password(self.identity.password)
         self.username = username
 
-        if password:
-            await self._send_raw(f"PASS {password}", immediate=True)
-        await self._send_raw(f"NICK {username}", immediate=True)
+        lines = [f"PASS {password}"] if password else []
+        lines.append(f"NICK {username}")
 
         caps: List[str] = []
         if self.options.request_tags:
@@ -137,48 +512,71 @@ class ClientBase(EventEmitter):
             caps.append("twitch.tv/membership")
 
         if caps:
-            await self._send_raw(f"CAP REQ :{' '.join(caps)}", immediate=True)
+            lines.append(f"CAP REQ :{' '.join(caps)}")
+
+        lines.append("")
+        await self._write_wire("\r\n".join(lines).encode("utf-8"), immediate=True)
 
     async def _close(self, reason: str) -> None:
         self.reason = reason
-        if self._read_task:
+        if self._read_task and self._read_task is not asyncio.current_task():
             self._read_task.cancel()
         if self._ping_task:
             self._ping_task.cancel()
+        if self._write_task:
+            self._write_task.cancel()
+        self._send_buf.clear()
+        waiter, self._flushed = self._flushed, None
+        if waiter and not waiter.done():
+            waiter.set_exception(NotConnectedError("Socket closed before data was sent."))
         self._command_queue.stop()
         self._message_queue.stop()
         self._join_queue.stop()
 
-        if self._writer:
-            self._writer.close()
+        if self._transport:
+            self._transport.close()
             try:
-                await self._writer.wait_closed()
+                if self._protocol:
+                    await self._protocol.wait_closed()
             except Exception:
                 pass
-        self._reader = None
-        self._writer = None
+        self._transport = None
+        self._protocol = None
         self._disconnect_event.set()
 
     async def _reader_loop(self) -> None:
-        assert self._reader is not None
+        lines = self._lines
+        protocol = self._protocol
+        reason = "Connection closed"
         try:
-            while not self._reader.at_eof():
-                raw = await self._reader.readline()
-                if not raw:
+            while True:
+                raw = await lines.get()
+                if raw is None:
                     break
-                data = raw.decode(errors="ignore").strip("\r\n")
-                if not data:
-                    continue
-                message = parse_message(data)
+                message = parse_message(raw.decode("utf-8", "ignore"))
                 if message:
                     await self._handle_message(message)
         except asyncio.CancelledError:
             pass
         except Exception as exc:
             self.emit("error", exc)
-            await self._handle_disconnect("Read error")
+            reason = "Read error"
         finally:
-            await self._handle_disconnect("Connection closed")
+            # A handler (RECONNECT, auth failure) may already have torn this connection down.
+            if self._protocol is protocol:
+                await self._handle_disconnect(reason)
+
+    async def _writer_loop(self) -> None:
+        try:
+            while True:
+                await self._flush_event.wait()
+                self._flush_event.clear()
+                try:
+                    await self._flush_send_buffer()
+                except Exception as exc:
+                    self.log.debug("Failed to flush send buffer: %s", exc)
+        except asyncio.CancelledError:
+            return
 
     async def _ping_loop(self) -> None:
         interval = max(30.0, self.connection.ping_interval)
@@ -188,53 +586,95 @@ class ClientBase(EventEmitter):
                 if not self.is_connected:
                     continue
                 self._latency_start = time.monotonic()
-                await self._send_raw(PING_PAYLOAD, immediate=True)
+                await self._write_wire(PING_WIRE, immediate=True)
                 self.emit("ping")
         except asyncio.CancelledError:
             return
 
     async def _handle_disconnect(self, reason: str) -> None:
+        await self._close(reason)
         if self.was_close_called:
-            await self._close(reason)
             return
 
-        await self._close(reason)
         self.emit("disconnected", reason)
+        if self.reconnect and not self.reconnecting:
+            self.reconnecting = True
+            self._reconnect_task = self.loop.create_task(self._reconnect_loop(reason))
 
-        if not self.reconnect:
-            return
-
-        if self.max_reconnect_attempts is not None and self.reconnections >= self.max_reconnect_attempts:
-            self.emit("reconnect_failed", reason)
-            return
-
-        self.reconnecting = True
-        self.reconnections += 1
-        delay = min(self.reconnect_timer, self.max_reconnect_interval)
-        self.reconnect_timer *= self.reconnect_decay
-        self.log.warn("Reconnecting in %.2f seconds (attempt %s)", delay, self.reconnections)
-        await asyncio.sleep(delay)
+    async def _reconnect_loop(self, reason: str) -> None:
         try:
-            await self._establish_connection()
+            while self.reconnect and not self.was_close_called:
+                if self.max_reconnect_attempts is not None and self.reconnections >= self.max_reconnect_attempts:
+                    self.emit("reconnect_failed", reason)
+                    return
+
+                self.reconnections += 1
+                delay = min(self.reconnect_timer, self.max_reconnect_interval)
+                self.reconnect_timer *= self.reconnect_decay
+                self.log.warn("Reconnecting in %.2f seconds (attempt %s)", delay, self.reconnections)
+                await asyncio.sleep(delay)
+                if self.was_close_called:
+                    return
+                try:
+                    await self._establish_connection()
+                except Exception as exc:
+                    # Authentication and re-joining run on the new socket too and can fail or time out;
+                    # tear the attempt down and retry rather than letting the loop die.
+                    self.log.warn("Reconnect attempt %s failed: %s", self.reconnections, exc)
+                    if self.listener_count("error"):
+                        self.emit("error", exc)
+                    await self._close("Reconnect attempt failed")
+                    continue
+                if not self.is_connected:
+                    # Dropped again while re-joining; the reader saw reconnecting=True and left it to us.
+                    continue
+
+                self.reconnect_timer = self.connection.reconnect_interval
+                self.reconnections = 0
+                self.emit("reconnected", self.server, self.port)
+                return
+        finally:
             self.reconnecting = False
-            self.reconnect_timer = self.connection.reconnect_interval
-            self.reconnections = 0
-            self.emit("reconnected", self.server, self.port)
-        except ConnectionError as exc:
-            self.emit("error", exc)
+            self._reconnect_task = None
 
     # ------------------------------------------------------------------ #
     # Public helpers
     # ------------------------------------------------------------------ #
+    @property
+    def messages_log_level(self) -> str:
+        return self._messages_log_level
+
+    @messages_log_level.setter
+    def messages_log_level(self, level: str) -> None:
+        self._messages_log_level = level
+        self._msg_log = getattr(self.log, level, self.log.info)
+
+    @property
+    def channels(self) -> List[str]:
+        """Joined channels in join order (backed by an insertion-ordered dict for O(1) updates)."""
+        return list(self._channels)
+
+    @channels.setter
+    def channels(self, channels: List[str]) -> None:
+        self._channels = dict.fromkeys(channels)
+
+    @property
+    def opts_channels(self) -> List[str]:
+        """Channels rejoined on (re)connect, in join order."""
+        return list(self._opts_channels)
+
+    @opts_channels.setter
+    def opts_channels(self, channels: List[str]) -> None:
+        self._opts_channels = dict.fromkeys(channels)
+
     @property
     def is_connected(self) -> bool:
-        return self._writer is not None and not self._writer.is_closing()
+        return self._transport is not None and not self._transport.is_closing()
 
     def ready_state(self) -> str:
-        if self._writer is None:
+        if self._transport is None:
             return "CLOSED"
-        transport = self._writer.transport
-        if transport.is_closing():
+        if self._transport.is_closing():
             return "CLOSING"
         return "OPEN"
 
@@ -245,12 +685,13 @@ class ClientBase(EventEmitter):
         return self.options
 
     def get_channels(self) -> List[str]:
-        return list(self.channels)
+        return list(self._channels)
 
     def is_mod(self, channel: str, username: str) -> bool:
-        chan = utils.channel(channel)
-        mods = self.moderators.setdefault(chan, [])
-        return utils.username(username) in mods
+        return utils.username(username) in self.moderators.get(utils.channel(channel), ())
+
+    def moderators_list(self, channel: str) -> List[str]:
+        return sorted(self.moderators.get(utils.channel(channel), ()))
 
     # ------------------------------------------------------------------ #
     # Sending commands and messages
@@ -263,22 +704,19 @@ class ClientBase(EventEmitter):
         if utils.is_justinfan(self.username):
             raise AnonymousMessageError("Cannot send anonymous messages.")
 
-        async def dispatch() -> None:
-            await self._send_privmsg(channel_name, message, tags or {})
-
-        await self._message_queue.add(dispatch)
+        await self._message_queue.add_call(self._send_privmsg, channel_name, message, tags or {})
         return (channel_name, message)
 
     async def join(self, channel: str) -> Tuple[str]:
         channel_name = utils.channel(channel)
         self.last_joined = channel_name
 
-        async def dispatch() -> None:
-            await self._send_raw(f"JOIN {channel_name}", immediate=True)
-
-        await self._join_queue.add(dispatch)
+        await self._join_queue.add_call(self._send_join, channel_name)
         return (channel_name,)
 
+    async def _send_join(self, channel_name: str) -> None:
+        await self._send_raw(f"JOIN {channel_name}", immediate=True)
+
     async def part(self, channel: str) -> Tuple[str]:
         channel_name = utils.channel(channel)
         await self._send_raw(f"PART {channel_name}")
@@ -294,24 +732,24 @@ class ClientBase(EventEmitter):
 
     async def _send_privmsg(self, channel: str, message: str, tags: Dict[str, Any]) -> None:
         payload_tags = form_tags(tags)
+        base_state = dict(self.userstate.get(channel, {}))
+        base_state["emotes"] = None
         for chunk in utils.paginate_message(message, PRIVMSG_LIMIT):
             line = f"{payload_tags + ' ' if payload_tags else ''}PRIVMSG {channel} :{chunk}"
             await self._send_raw(line)
-            action_match = utils.action_message(chunk)
-            merged_state = dict(self.userstate.get(channel, {}))
-            merged_state["emotes"] = None
-            message_type = "action" if action_match else "chat"
-            merged_state["message-type"] = message_type
-            log_message = action_match.group(1) if action_match else chunk
-            getattr(self.log, self.messages_log_level, self.log.info)(
-                f"[{channel}] <{self.username}>: {log_message}"
-            )
-            self.emit_many(
-                ["action", "message"] if action_match else ["chat", "message"],
-                [
-                    (channel, merged_state, log_message, True),
-                ],
-            )
+            action = utils.action_text(chunk)
+            # Each chunk gets its own copy so listeners never see a state mutated after emit.
+            merged_state = base_state.copy()
+            if action is not None:
+                log_message = action
+                merged_state["message-type"] = "action"
+                events = ACTION_EVENTS
+            else:
+                log_message = chunk
+                merged_state["message-type"] = "chat"
+                events = CHAT_EVENTS
+            self._msg_log("[%s] <%s>: %s", channel, self.username, log_message)
+            self.emit_fanout(events, channel, merged_state, log_message, True)
 
     async def _send_command(
         self,
@@ -320,25 +758,60 @@ class ClientBase(EventEmitter):
         *,
         tags: Optional[Dict[str, Any]] = None,
     ) -> None:
-        async def dispatch() -> None:
-            payload_tags = form_tags(tags or {})
-            if channel:
-                line = f"{payload_tags + ' ' if payload_tags else ''}PRIVMSG {channel} :{command}"
-            else:
-                line = f"{payload_tags + ' ' if payload_tags else ''}{command}"
-            await self._send_raw(line)
+        if channel:
+            await self._command_queue.add_call(self._dispatch_command, channel, command, tags)
+        else:
+            await self._dispatch_command(None, command, tags)
 
+    async def _dispatch_command(self, channel: Optional[str], command: str, tags: Optional[Dict[str, Any]]) -> None:
+        wire = COMMAND_WIRE.get(command) if channel and not tags else None
+        if wire is not None:
+            await self._write_wire(b"PRIVMSG " + channel.encode("utf-8") + b" :" + wire)
+            return
+        payload_tags = form_tags(tags or {})
         if channel:
-            await self._command_queue.add(dispatch)
+            line = f"{payload_tags + ' ' if payload_tags else ''}PRIVMSG {channel} :{command}"
         else:
-            await dispatch()
+            line = f"{payload_tags + ' ' if payload_tags else ''}{command}"
+        await self._send_raw(line)
 
     async def _send_raw(self, payload: str, *, immediate: bool = False) -> None:
-        if not self._writer:
+        await self._write_wire(f"{payload}\r\n".encode("utf-8"), immediate=immediate)
+
+    async def _write_wire(self, wire: bytes, *, immediate: bool = False) -> None:
+        """Queue an already encoded, CRLF-terminated line on the send buffer."""
+        if not self._transport:
             raise NotConnectedError("Socket is not open.")
-        data = f"{payload}\r\n".encode("utf-8")
-        self._writer.write(data)
-        await self._writer.drain()
+        self._send_buf += wire
+        if immediate:
+            await self._flush_send_buffer()
+            return
+        if self._flushed is None:
+            self._flushed = self.loop.create_future()
+        waiter = self._flushed
+        self._flush_event.set()
+        await waiter
+
+    async def _flush_send_buffer(self) -> None:
+        """Write everything buffered so far, at most ``SEND_BUFFER_LIMIT`` bytes per write."""
+        waiter, self._flushed = self._flushed, None
+        try:
+            while self._send_buf:
+                if not self._transport or not self._protocol:
+                    raise NotConnectedError("Socket is not open.")
+                chunk = bytes(self._send_buf[:SEND_BUFFER_LIMIT])
+                del self._send_buf[:SEND_BUFFER_LIMIT]
+                self._transport.write(chunk)
+                await self._protocol.drain()
+        except BaseException as exc:
+            # The waiter is already detached from self._flushed, so _close cannot fail it for us.
+            if waiter and not waiter.done():
+                if isinstance(exc, asyncio.CancelledError):
+                    exc = NotConnectedError("Socket closed before data was sent.")
+                waiter.set_exception(exc)
+            raise
+        if waiter and not waiter.done():
+            waiter.set_result(None)
 
     # ------------------------------------------------------------------ #
     # Await helpers
@@ -374,22 +847,29 @@ class ClientBase(EventEmitter):
             return
 
         if self.listener_count("raw_message"):
-            self.emit("raw_message", dict(message.__dict__), message)
+            self.emit("raw_message", message)
 
-        message.tags = parse_emotes(parse_badge_info(parse_badges(message.tags)))
+        if message.prefix is None and not message.tags:
+            # Server PING/PONG: nothing to normalize, answer straight away.
+            await self._handle_server_message(message)
+            return
 
-        for key, value in list(message.tags.items()):
-            if key in {"emote-sets", "ban-duration", "bits"}:
+        # The tag dict is owned by this message, so values are normalized in place and handlers
+        # annotate and emit it without copying. Only the values that change are written back.
+        unescape = utils.unescape_irc
+        tags = parse_emotes(parse_badge_info(parse_badges(message.tags)))
+        for key, value in tags.items():
+            if key in _RAW_TAGS:
                 continue
-            if isinstance(value, str):
+            if value is True:
+                tags[key] = None
+            elif isinstance(value, str):
                 if value == "1":
-                    message.tags[key] = True
+                    tags[key] = True
                 elif value == "0":
-                    message.tags[key] = False
-                else:
-                    message.tags[key] = utils.unescape_irc(value)
-            elif value is True:
-                message.tags[key] = None
+                    tags[key] = False
+                elif "\\" in value:
+                    tags[key] = unescape(value)
 
         if message.prefix is None:
             await self._handle_server_message(message)
@@ -399,404 +879,157 @@ class ClientBase(EventEmitter):
     async def _handle_server_message(self, message: IRCMessage) -> None:
         command = message.command
         if command == "PING":
-            await self._send_raw(PONG_PAYLOAD, immediate=True)
+            await self._write_wire(PONG_WIRE, immediate=True)
             self.emit("pong")
         elif command == "PONG":
             self.current_latency = time.monotonic() - self._latency_start
-            self.emit_many(["pong", "_promisePing"], [ (self.current_latency,), ])
+            latency = (self.current_latency,)
+            self.emit_pair("pong", latency, "_promisePing", latency)
 
     async def _handle_user_message(self, message: IRCMessage) -> None:
         command = message.command
-        if command == "PRIVMSG":
-            await self._handle_privmsg(message)
-        elif command == "WHISPER":
-            await self._handle_whisper(message)
-        elif command == "NOTICE":
-            await self._handle_notice(message)
-        elif command == "USERNOTICE":
-            await self._handle_usernotice(message)
-        elif command == "CLEARCHAT":
-            await self._handle_clearchat(message)
-        elif command == "CLEARMSG":
-            await self._handle_clearmsg(message)
-        elif command == "ROOMSTATE":
-            await self._handle_roomstate(message)
-        elif command == "USERSTATE":
-            await self._handle_userstate(message)
-        elif command == "GLOBALUSERSTATE":
-            await self._handle_globaluserstate(message)
-        elif command == "RECONNECT":
-            await self._handle_reconnect(message)
-        elif command == "JOIN":
-            await self._handle_join(message)
-        elif command == "PART":
-            await self._handle_part(message)
-        elif command == "MODE":
-            await self._handle_mode(message)
-        elif command == "353":
-            await self._handle_names(message)
-        elif command == "366":
-            await self._handle_endofnames(message)
+        handler = self._user_handlers.get(command)
+        if handler is not None:
+            await handler(message)
         elif command == "001":
             self.emit("connected", self.server, self.port)
-        elif command in {"002", "003", "004", "375", "372", "376"}:
-            pass
         elif command == "421":
             self.log.warn("Unsupported IRC command reported: %s", message.params)
 
     async def _handle_privmsg(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
         msg = message.param(1) or ""
-        username = utils.username(message.prefix.split("!")[0])
+        username = utils.username(message.prefix.partition("!")[0])
 
         if message.tags.get("emotes-raw"):
             self.emotes = message.tags["emotes-raw"]  # type: ignore[assignment]
 
         message.tags["username"] = username
-        action_match = utils.action_message(msg)
-        message.tags["message-type"] = "action" if action_match else "chat"
-        cleaned_msg = action_match.group(1) if action_match else msg
+        action = utils.action_text(msg)
+        is_action = action is not None
+        message.tags["message-type"] = "action" if is_action else "chat"
+        cleaned_msg = action if is_action else msg
 
         if username == "jtv":
             name = utils.username(msg.split(" ")[0])
             autohost = "auto" in msg
             if "hosting you for" in msg:
-                count = 0
-                for part in msg.split():
-                    if utils.is_integer(part):
-                        count = int(part)
-                        break
-                self.emit("hosted", channel, name, count, autohost)
+                match = _HOST_COUNT_RE.search(msg)
+                self.emit("hosted", channel, name, int(match.group(1)) if match else 0, autohost)
             elif "hosting you" in msg:
                 self.emit("hosted", channel, name, 0, autohost)
             return
 
-        log_func = getattr(self.log, self.messages_log_level, self.log.info)
-
-        if "bits" in message.tags:
-            self.emit("cheer", channel, message.tags, cleaned_msg)
-        else:
+        tags = message.tags
+        if "bits" in tags:
+            if self.listener_count("cheer"):
+                self.emit("cheer", channel, tags, cleaned_msg)
+        elif self.listener_count("redeem"):
             reward_id = None
-            if "msg-id" in message.tags and message.tags["msg-id"] in {"highlighted-message", "skip-subs-mode-message"}:
-                reward_id = message.tags["msg-id"]
-            elif "custom-reward-id" in message.tags:
-                reward_id = message.tags["custom-reward-id"]
+            if tags.get("msg-id") in {"highlighted-message", "skip-subs-mode-message"}:
+                reward_id = tags["msg-id"]
+            elif "custom-reward-id" in tags:
+                reward_id = tags["custom-reward-id"]
             if reward_id:
-                self.emit("redeem", channel, username, reward_id, message.tags, cleaned_msg)
+                self.emit("redeem", channel, username, reward_id, tags, cleaned_msg)
 
-        if action_match:
-            log_func(f"[{channel}] *<{username}>: {cleaned_msg}")
-            self.emit_many(
-                ["action", "message"],
-                [(channel, message.tags, cleaned_msg, False)],
-            )
-        else:
-            log_func(f"[{channel}] <{username}>: {cleaned_msg}")
-            self.emit_many(
-                ["chat", "message"],
-                [(channel, message.tags, cleaned_msg, False)],
-            )
+        if self.log.is_enabled_for(self._messages_log_level):
+            self._msg_log("[%s] *<%s>: %s" if is_action else "[%s] <%s>: %s", channel, username, cleaned_msg)
+        self.emit_fanout(ACTION_EVENTS if is_action else CHAT_EVENTS, channel, tags, cleaned_msg, False)
 
     async def _handle_whisper(self, message: IRCMessage) -> None:
-        username = utils.username(message.prefix.split("!")[0])
+        username = utils.username(message.prefix.partition("!")[0])
         msg = message.param(1) or ""
-        userstate = dict(message.tags)
+        userstate = message.tags
         userstate["message-type"] = "whisper"
         userstate["username"] = username
-        self.log.info(f"[WHISPER] <{username}>: {msg}")
-        self.emit_many(
-            ["whisper", "message"],
-            [
-                (username, userstate, msg, False),
-            ],
-        )
+        self.log.info("[WHISPER] <%s>: %s", username, msg)
+        self.emit_fanout(WHISPER_EVENTS, username, userstate, msg, False)
 
     async def _handle_notice(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
         msg = message.param(1) or ""
         msgid = message.tags.get("msg-id")
 
-        notice_payload = (channel, msgid, msg)
-        null_payload = (None,)
-        msgid_payload = (msgid,)
-        channel_true = (channel, True)
-        channel_false = (channel, False)
-        basic_log = f"[{channel}] {msg}"
-
-        if msgid == "subs_on":
-            self.log.info(f"[{channel}] This room is now in subscribers-only mode.")
-            self.emit_many(["subscriber", "subscribers", "_promiseSubscribers"], [channel_true, channel_true, (None,)])
-        elif msgid == "subs_off":
-            self.log.info(f"[{channel}] This room is no longer in subscribers-only mode.")
-            self.emit_many(["subscriber", "subscribers", "_promiseSubscribersoff"], [channel_false, channel_false, (None,)])
-        elif msgid == "emote_only_on":
-            self.log.info(f"[{channel}] This room is now in emote-only mode.")
-            self.emit_many(["emoteonly", "_promiseEmoteonly"], [channel_true, (None,)])
-        elif msgid == "emote_only_off":
-            self.log.info(f"[{channel}] This room is no longer in emote-only mode.")
-            self.emit_many(["emoteonly", "_promiseEmoteonlyoff"], [channel_false, (None,)])
-        elif msgid in {"slow_on", "slow_off", "followers_on_zero", "followers_on", "followers_off"}:
-            return
-        elif msgid == "r9k_on":
-            self.log.info(f"[{channel}] This room is now in r9k mode.")
-            self.emit_many(["r9kmode", "r9kbeta", "_promiseR9kbeta"], [channel_true, channel_true, (None,)])
-        elif msgid == "r9k_off":
-            self.log.info(f"[{channel}] This room is no longer in r9k mode.")
-            self.emit_many(["r9kmode", "r9kbeta", "_promiseR9kbetaoff"], [channel_false, channel_false, (None,)])
-        elif msgid == "room_mods":
-            parts = msg.split(": ")
-            mods = (parts[1] if len(parts) > 1 else "").lower().split(", ")
-            mods = [name for name in mods if name]
-            self.emit_many(["_promiseMods", "mods"], [(None, mods), (channel, mods)])
-        elif msgid == "no_mods":
-            self.emit_many(["_promiseMods", "mods"], [(None, []), (channel, [])])
-        elif msgid == "vips_success":
-            trimmed = msg[:-1] if msg.endswith(".") else msg
-            parts = trimmed.split(": ")
-            vips = (parts[1] if len(parts) > 1 else "").lower().split(", ")
-            vips = [name for name in vips if name]
-            self.emit_many(["_promiseVips", "vips"], [(None, vips), (channel, vips)])
-        elif msgid == "no_vips":
-            self.emit_many(["_promiseVips", "vips"], [(None, []), (channel, [])])
-        elif msgid in {
-            "already_banned",
-            "bad_ban_admin",
-            "bad_ban_anon",
-            "bad_ban_broadcaster",
-            "bad_ban_global_mod",
-            "bad_ban_mod",
-            "bad_ban_self",
-            "bad_ban_staff",
-            "usage_ban",
-        }:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseBan"], [notice_payload, msgid_payload])
-        elif msgid == "ban_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseBan"], [notice_payload, null_payload])
-        elif msgid == "usage_clear":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseClear"], [notice_payload, msgid_payload])
-        elif msgid == "usage_mods":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseMods"], [notice_payload, (msgid, [])])
-        elif msgid == "mod_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseMod"], [notice_payload, null_payload])
-        elif msgid == "usage_vips":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseVips"], [notice_payload, (msgid, [])])
-        elif msgid == "usage_vip":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseVip"], [notice_payload, msgid_payload])
-        elif msgid in {"bad_vip_grantee_banned", "bad_vip_grantee_already_vip", "bad_vip_max_vips_reached", "bad_vip_achievement_incomplete"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseVip"], [notice_payload, msgid_payload])
-        elif msgid == "vip_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseVip"], [notice_payload, null_payload])
-        elif msgid == "usage_mod":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseMod"], [notice_payload, msgid_payload])
-        elif msgid in {"bad_mod_banned", "bad_mod_mod"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseMod"], [notice_payload, msgid_payload])
-        elif msgid == "unmod_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnmod"], [notice_payload, null_payload])
-        elif msgid == "unvip_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnvip"], [notice_payload, null_payload])
-        elif msgid == "usage_unmod":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnmod"], [notice_payload, msgid_payload])
-        elif msgid == "bad_unmod_mod":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnmod"], [notice_payload, msgid_payload])
-        elif msgid == "usage_unvip":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnvip"], [notice_payload, msgid_payload])
-        elif msgid == "bad_unvip_grantee_not_vip":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnvip"], [notice_payload, msgid_payload])
-        elif msgid == "color_changed":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseColor"], [notice_payload, null_payload])
-        elif msgid in {"usage_color", "turbo_only_color"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseColor"], [notice_payload, msgid_payload])
-        elif msgid == "commercial_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseCommercial"], [notice_payload, null_payload])
-        elif msgid in {"usage_commercial", "bad_commercial_error"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseCommercial"], [notice_payload, msgid_payload])
-        elif msgid == "hosts_remaining":
-            remaining = 0
-            try:
-                remaining = int("".join(filter(str.isdigit, msg)))
-            except ValueError:
-                remaining = 0
-            self.emit_many(["notice", "_promiseHost"], [notice_payload, (None, remaining)])
-        elif msgid in {"bad_host_hosting", "bad_host_rate_exceeded", "bad_host_error", "usage_host"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseHost"], [notice_payload, msgid_payload])
-        elif msgid in {"already_r9k_on", "usage_r9k_on"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseR9kbeta"], [notice_payload, msgid_payload])
-        elif msgid in {"already_r9k_off", "usage_r9k_off"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseR9kbetaoff"], [notice_payload, msgid_payload])
-        elif msgid == "timeout_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseTimeout"], [notice_payload, null_payload])
-        elif msgid == "delete_message_success":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseDeletemessage"], [notice_payload, null_payload])
-        elif msgid in {"already_subs_off", "usage_subs_off", "already_subs_on", "usage_subs_on"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseSubscribers"], [notice_payload, msgid_payload])
-        elif msgid in {"already_emote_only_off", "usage_emote_only_off", "already_emote_only_on", "usage_emote_only_on"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseEmoteonly"], [notice_payload, msgid_payload])
-        elif msgid == "usage_slow_on":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseSlow"], [notice_payload, msgid_payload])
-        elif msgid == "usage_slow_off":
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseSlowoff"], [notice_payload, msgid_payload])
-        elif msgid in {
-            "usage_timeout",
-            "bad_timeout_admin",
-            "bad_timeout_anon",
-            "bad_timeout_broadcaster",
-            "bad_timeout_duration",
-            "bad_timeout_global_mod",
-            "bad_timeout_mod",
-            "bad_timeout_self",
-            "bad_timeout_staff",
-        }:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseTimeout"], [notice_payload, msgid_payload])
-        elif msgid in {"untimeout_success", "unban_success"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnban"], [notice_payload, null_payload])
-        elif msgid in {"usage_unban", "bad_unban_no_ban"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnban"], [notice_payload, msgid_payload])
-        elif msgid in {"usage_delete", "bad_delete_message_error", "bad_delete_message_broadcaster", "bad_delete_message_mod"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseDeletemessage"], [notice_payload, msgid_payload])
-        elif msgid in {"usage_unhost", "not_hosting"}:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseUnhost"], [notice_payload, msgid_payload])
-        elif msgid in {
-            "whisper_invalid_login",
-            "whisper_invalid_self",
-            "whisper_limit_per_min",
-            "whisper_limit_per_sec",
-            "whisper_restricted",
-            "whisper_restricted_recipient",
-        }:
-            self.log.info(basic_log)
-            self.emit_many(["notice", "_promiseWhisper"], [notice_payload, msgid_payload])
-        elif msgid in {
-            "no_permission",
-            "msg_banned",
-            "msg_room_not_found",
-            "msg_channel_suspended",
-            "tos_ban",
-            "invalid_user",
-        }:
-            self.log.info(basic_log)
-            events = [
-                "notice",
-                "_promiseBan",
-                "_promiseClear",
-                "_promiseUnban",
-                "_promiseTimeout",
-                "_promiseDeletemessage",
-                "_promiseMods",
-                "_promiseMod",
-                "_promiseUnmod",
-                "_promiseVips",
-                "_promiseVip",
-                "_promiseUnvip",
-                "_promiseCommercial",
-                "_promiseHost",
-                "_promiseUnhost",
-                "_promiseJoin",
-                "_promisePart",
-                "_promiseR9kbeta",
-                "_promiseR9kbetaoff",
-                "_promiseSlow",
-                "_promiseSlowoff",
-                "_promiseFollowers",
-                "_promiseFollowersoff",
-                "_promiseSubscribers",
-                "_promiseSubscribersoff",
-                "_promiseEmoteonly",
-                "_promiseEmoteonlyoff",
-                "_promiseWhisper",
-            ]
-            payloads = [notice_payload, (msgid, channel)]
-            self.emit_many(events, payloads)
-        elif msgid in {"msg_rejected", "msg_rejected_mandatory"}:
-            self.log.info(basic_log)
-            self.emit("automod", channel, msgid, msg)
-        elif msgid == "unrecognized_cmd":
-            self.log.info(basic_log)
+        entry = _NOTICE_PROMISES.get(msgid)
+        if entry is not None:
+            self.log.info("[%s] %s", channel, msg)
             self.emit("notice", channel, msgid, msg)
-        elif msgid in {
-            "cmds_available",
-            "host_target_went_offline",
-            "msg_censored_broadcaster",
-            "msg_duplicate",
-            "msg_emoteonly",
-            "msg_verified_email",
-            "msg_ratelimit",
-            "msg_subsonly",
-            "msg_timedout",
-            "msg_bad_characters",
-            "msg_channel_blocked",
-            "msg_facebook",
-            "msg_followersonly",
-            "msg_followersonly_followed",
-            "msg_followersonly_zero",
-            "msg_slowmode",
-            "msg_suspended",
-            "no_help",
-            "usage_disconnect",
-            "usage_help",
-            "usage_me",
-            "unavailable_command",
-        }:
-            self.log.info(basic_log)
-            self.emit("notice", channel, msgid, msg)
-        elif msgid in {"host_on", "host_off"}:
+            self.emit(entry[0], *entry[1])
             return
+        mode = _NOTICE_MODES.get(msgid)
+        if mode is not None:
+            text, events, promise, enabled = mode
+            self.log.info("[%s] %s", channel, text)
+            for event in events:
+                self.emit(event, channel, enabled)
+            self.emit(promise, None)
+            return
+
+        handler = _NOTICE_HANDLERS.get(msgid)
+        if handler is not None:
+            handler(self, channel, msgid, msg)
+            return
+
+        match = _AUTH_FAILURE_RE.search(msg)
+        if match is not None:
+            reason = msg
+            # Login failures take precedence over "Invalid NICK" when both appear.
+            if match.group() == "Invalid NICK" and all(
+                other.group() == "Invalid NICK" for other in _AUTH_FAILURE_RE.finditer(msg, match.end())
+            ):
+                reason = "Invalid NICK."
+            self.was_close_called = False
+            self.reconnect = False
+            self.reason = reason
+            self.log.error(self.reason)
+            await self._handle_disconnect(reason)
         else:
-            if "Login unsuccessful" in msg or "Login authentication failed" in msg:
-                self.was_close_called = False
-                self.reconnect = False
-                self.reason = msg
-                self.log.error(self.reason)
-                await self._handle_disconnect(msg)
-            elif "Error logging in" in msg or "Improperly formatted auth" in msg:
-                self.was_close_called = False
-                self.reconnect = False
-                self.reason = msg
-                self.log.error(self.reason)
-                await self._handle_disconnect(msg)
-            elif "Invalid NICK" in msg:
-                self.was_close_called = False
-                self.reconnect = False
-                self.reason = "Invalid NICK."
-                self.log.error(self.reason)
-                await self._handle_disconnect(self.reason)
-            else:
-                self.log.warn(f"Could not parse NOTICE from tmi.twitch.tv: {message.raw}")
-                self.emit("notice", channel, msgid, msg)
+            self.log.warn("Could not parse NOTICE from tmi.twitch.tv: %s", message.raw)
+            self.emit("notice", channel, msgid, msg)
+
+    def _notice_plain(self, channel: str, msgid: str, msg: str) -> None:
+        self.log.info("[%s] %s", channel, msg)
+        self.emit("notice", channel, msgid, msg)
+
+    def _notice_automod(self, channel: str, msgid: str, msg: str) -> None:
+        self.log.info("[%s] %s", channel, msg)
+        self.emit("automod", channel, msgid, msg)
+
+    def _notice_rejected(self, channel: str, msgid: str, msg: str) -> None:
+        self.log.info("[%s] %s", channel, msg)
+        self.emit("notice", channel, msgid, msg)
+        self.emit_fanout(_REJECTED_PROMISES, msgid, channel)
+
+    def _notice_room_mods(self, channel: str, msgid: str, msg: str) -> None:
+        mods = [name for name in msg.partition(": ")[2].lower().split(", ") if name]
+        self.emit_pair("_promiseMods", (None, mods), "mods", (channel, mods))
+
+    def _notice_no_mods(self, channel: str, msgid: str, msg: str) -> None:
+        self.emit_pair("_promiseMods", (None, []), "mods", (channel, []))
+
+    def _notice_vips_success(self, channel: str, msgid: str, msg: str) -> None:
+        trimmed = msg[:-1] if msg.endswith(".") else msg
+        vips = [name for name in trimmed.partition(": ")[2].lower().split(", ") if name]
+        self.emit_pair("_promiseVips", (None, vips), "vips", (channel, vips))
+
+    def _notice_no_vips(self, channel: str, msgid: str, msg: str) -> None:
+        self.emit_pair("_promiseVips", (None, []), "vips", (channel, []))
+
+    def _notice_usage_mods(self, channel: str, msgid: str, msg: str) -> None:
+        self.log.info("[%s] %s", channel, msg)
+        self.emit_pair("notice", (channel, msgid, msg), "_promiseMods", (msgid, []))
+
+    def _notice_usage_vips(self, channel: str, msgid: str, msg: str) -> None:
+        self.log.info("[%s] %s", channel, msg)
+        self.emit_pair("notice", (channel, msgid, msg), "_promiseVips", (msgid, []))
+
+    def _notice_hosts_remaining(self, channel: str, msgid: str, msg: str) -> None:
+        match = _DIGITS_RE.search(msg)
+        self.emit_pair("notice", (channel, msgid, msg), "_promiseHost", (None, int(match.group()) if match else 0))
+
+    def _notice_ignored(self, channel: str, msgid: str, msg: str) -> None:
+        pass
 
     async def _handle_usernotice(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
@@ -804,51 +1037,56 @@ class ClientBase(EventEmitter):
         tags = message.tags
         msgid = tags.get("msg-id")
         username = tags.get("display-name") or tags.get("login")
-        plan = tags.get("msg-param-sub-plan", "")
-        plan_name_raw = tags.get("msg-param-sub-plan-name") or ""
-        plan_name = utils.unescape_irc(plan_name_raw) if plan_name_raw else None
-        prime = "Prime" in plan if isinstance(plan, str) else False
-        methods = {"prime": prime, "plan": plan, "plan_name": plan_name}
-        streak_months = int(tags.get("msg-param-streak-months") or 0)
-        recipient = tags.get("msg-param-recipient-display-name") or tags.get("msg-param-recipient-user-name")
-        gift_sub_count = int(tags.get("msg-param-mass-gift-count") or 0)
         tags["message-type"] = msgid
 
-        if msgid == "resub":
-            self.emit_many(
-                ["resub", "subanniversary"],
-                [(channel, username, streak_months, msg, tags, methods)],
-            )
-        elif msgid == "sub":
-            self.emit_many(
-                ["subscription", "sub"],
-                [(channel, username, methods, msg, tags)],
-            )
-        elif msgid == "subgift":
-            self.emit("subgift", channel, username, streak_months, recipient, methods, tags)
-        elif msgid == "anonsubgift":
-            self.emit("anonsubgift", channel, streak_months, recipient, methods, tags)
-        elif msgid == "submysterygift":
-            self.emit("submysterygift", channel, username, gift_sub_count, methods, tags)
-        elif msgid == "anonsubmysterygift":
-            self.emit("anonsubmysterygift", channel, gift_sub_count, methods, tags)
-        elif msgid == "primepaidupgrade":
-            self.emit("primepaidupgrade", channel, username, methods, tags)
-        elif msgid == "giftpaidupgrade":
-            sender = tags.get("msg-param-sender-name") or tags.get("msg-param-sender-login")
-            self.emit("giftpaidupgrade", channel, username, sender, tags)
-        elif msgid == "anongiftpaidupgrade":
-            self.emit("anongiftpaidupgrade", channel, username, tags)
-        elif msgid == "announcement":
-            color = tags.get("msg-param-color")
-            self.emit("announcement", channel, tags, msg, False, color)
-        elif msgid == "raid":
-            raider = tags.get("msg-param-displayName") or tags.get("msg-param-login")
-            viewers = int(tags.get("msg-param-viewerCount") or 0)
-            self.emit("raided", channel, raider, viewers, tags)
+        handler = _USERNOTICE_HANDLERS.get(msgid)
+        if handler is not None:
+            handler(self, channel, username, msg, tags)
         else:
             self.emit("usernotice", msgid, channel, tags, msg)
 
+    def _usernotice_resub(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        payload = (channel, username, _streak_months(tags), msg, tags, _sub_methods(tags))
+        self.emit_pair("resub", payload, "subanniversary", payload)
+
+    def _usernotice_sub(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        payload = (channel, username, _sub_methods(tags), msg, tags)
+        self.emit_pair("subscription", payload, "sub", payload)
+
+    def _usernotice_subgift(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        self.emit("subgift", channel, username, _streak_months(tags), _recipient(tags), _sub_methods(tags), tags)
+
+    def _usernotice_anonsubgift(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        self.emit("anonsubgift", channel, _streak_months(tags), _recipient(tags), _sub_methods(tags), tags)
+
+    def _usernotice_submysterygift(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        self.emit("submysterygift", channel, username, _gift_sub_count(tags), _sub_methods(tags), tags)
+
+    def _usernotice_anonsubmysterygift(
+        self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]
+    ) -> None:
+        self.emit("anonsubmysterygift", channel, _gift_sub_count(tags), _sub_methods(tags), tags)
+
+    def _usernotice_primepaidupgrade(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        self.emit("primepaidupgrade", channel, username, _sub_methods(tags), tags)
+
+    def _usernotice_giftpaidupgrade(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        sender = tags.get("msg-param-sender-name") or tags.get("msg-param-sender-login")
+        self.emit("giftpaidupgrade", channel, username, sender, tags)
+
+    def _usernotice_anongiftpaidupgrade(
+        self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]
+    ) -> None:
+        self.emit("anongiftpaidupgrade", channel, username, tags)
+
+    def _usernotice_announcement(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        self.emit("announcement", channel, tags, msg, False, tags.get("msg-param-color"))
+
+    def _usernotice_raid(self, channel: str, username: Any, msg: Optional[str], tags: Dict[str, Any]) -> None:
+        raider = tags.get("msg-param-displayName") or tags.get("msg-param-login")
+        viewers = _tag_int(tags.get("msg-param-viewerCount"))
+        self.emit("raided", channel, raider, viewers, tags)
+
     async def _handle_clearchat(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
         username = utils.username(message.param(1) or "")
@@ -856,104 +1094,101 @@ class ClientBase(EventEmitter):
         reason = message.tags.get("ban-reason")
         if username:
             if duration is None:
-                self.log.info(f"[{channel}] {username} has been banned.")
+                self.log.info("[%s] %s has been banned.", channel, username)
                 self.emit("ban", channel, username, reason, message.tags)
             else:
-                seconds = int(duration)
-                self.log.info(f"[{channel}] {username} has been timed out for {seconds} seconds.")
+                seconds = _tag_int(duration)
+                self.log.info("[%s] %s has been timed out for %s seconds.", channel, username, seconds)
                 self.emit("timeout", channel, username, reason, seconds, message.tags)
         else:
-            self.log.info(f"[{channel}] Chat was cleared by a moderator.")
-            self.emit_many(["clearchat", "_promiseClear"], [(channel,), (None,)])
+            self.log.info("[%s] Chat was cleared by a moderator.", channel)
+            self.emit_pair("clearchat", (channel,), "_promiseClear", (None,))
 
     async def _handle_clearmsg(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
         deleted_message = message.param(1) or ""
-        tags = dict(message.tags)
+        tags = message.tags
         username = tags.get("login")
         tags["message-type"] = "messagedeleted"
-        self.log.info(f"[{channel}] {username}'s message has been deleted.")
+        self.log.info("[%s] %s's message has been deleted.", channel, username)
         self.emit("messagedeleted", channel, username, deleted_message, tags)
 
     async def _handle_hosttarget(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
         payload = message.param(1) or ""
-        parts = payload.split(" ")
-        target = parts[0] if parts else "-"
-        viewers = 0
-        if len(parts) > 1:
-            try:
-                viewers = int(parts[1])
-            except ValueError:
-                viewers = 0
+        target, _, count = payload.partition(" ")
+        try:
+            viewers = int(count) if count else 0
+        except ValueError:
+            viewers = 0
         if target == "-":
-            self.log.info(f"[{channel}] Exited host mode.")
-            self.emit_many(["unhost", "_promiseUnhost"], [(channel, viewers), (None,)])
+            self.log.info("[%s] Exited host mode.", channel)
+            self.emit_pair("unhost", (channel, viewers), "_promiseUnhost", (None,))
         else:
-            self.log.info(f"[{channel}] Now hosting {target} for {viewers} viewer(s).")
+            self.log.info("[%s] Now hosting %s for %s viewer(s).", channel, target, viewers)
             self.emit("hosting", channel, target, viewers)
 
     async def _handle_roomstate(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
-        tags = dict(message.tags)
-        if utils.channel(self.last_joined) == channel:
+        tags = message.tags
+        if self.last_joined == channel:
             self.emit("_promiseJoin", None, channel)
 
         tags["channel"] = channel
         self.emit("roomstate", channel, tags)
 
-        if "subs-only" not in tags:
-            if "slow" in tags:
-                slow_value = tags["slow"]
-                if isinstance(slow_value, bool) and not slow_value:
-                    disabled = (channel, False, 0)
-                    self.log.info(f"[{channel}] This room is no longer in slow mode.")
-                    self.emit_many(["slow", "slowmode", "_promiseSlowoff"], [disabled, disabled, (None,)])
+        # Full snapshots (on join and reconnect) carry subs-only and only repeat the current state;
+        # slow/followers-only changes arrive as single-tag updates.
+        if "subs-only" in tags:
+            return
+
+        if "slow" in tags:
+            slow_value = tags["slow"]
+            if isinstance(slow_value, bool) and not slow_value:
+                disabled = (channel, False, 0)
+                self.log.info("[%s] This room is no longer in slow mode.", channel)
+                self.emit_many(SLOW_OFF_EVENTS, (disabled, disabled, (None,)))
+            else:
+                try:
+                    seconds = int(slow_value)
+                except (TypeError, ValueError):
+                    seconds = 0
+                enabled = (channel, True, seconds)
+                self.log.info("[%s] This room is now in slow mode.", channel)
+                self.emit_many(SLOW_ON_EVENTS, (enabled, enabled, (None,)))
+
+        if "followers-only" in tags:
+            value = tags["followers-only"]
+            if value == "-1":
+                disabled = (channel, False, 0)
+                self.log.info("[%s] This room is no longer in followers-only mode.", channel)
+                self.emit_many(FOLLOWERS_OFF_EVENTS, (disabled, disabled, (None,)))
+            else:
+                if isinstance(value, bool) and not value:
+                    minutes = 0
                 else:
                     try:
-                        seconds = int(slow_value)
+                        minutes = int(value)
                     except (TypeError, ValueError):
-                        seconds = 0
-                    enabled = (channel, True, seconds)
-                    self.log.info(f"[{channel}] This room is now in slow mode.")
-                    self.emit_many(["slow", "slowmode", "_promiseSlow"], [enabled, enabled, (None,)])
-
-            if "followers-only" in tags:
-                value = tags["followers-only"]
-                if value == "-1":
-                    disabled = (channel, False, 0)
-                    self.log.info(f"[{channel}] This room is no longer in followers-only mode.")
-                    self.emit_many(["followersonly", "followersmode", "_promiseFollowersoff"], [disabled, disabled, (None,)])
-                else:
-                    if isinstance(value, bool) and not value:
                         minutes = 0
-                    else:
-                        try:
-                            minutes = int(value)
-                        except (TypeError, ValueError):
-                            minutes = 0
-                    enabled = (channel, True, minutes)
-                    self.log.info(f"[{channel}] This room is now in follower-only mode.")
-                    self.emit_many(["followersonly", "followersmode", "_promiseFollowers"], [enabled, enabled, (None,)])
+                enabled = (channel, True, minutes)
+                self.log.info("[%s] This room is now in follower-only mode.", channel)
+                self.emit_many(FOLLOWERS_ON_EVENTS, (enabled, enabled, (None,)))
 
     async def _handle_userstate(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
-        tags = dict(message.tags)
+        tags = message.tags
         tags["username"] = self.username
 
         if tags.get("user-type") == "mod":
-            mods = self.moderators.setdefault(channel, [])
-            if self.username not in mods:
-                mods.append(self.username)
+            self.moderators.setdefault(channel, set()).add(self.username)
 
         if not utils.is_justinfan(self.username) and channel not in self.userstate:
             self.userstate[channel] = tags
             self.last_joined = channel
-            if channel not in self.channels:
-                self.channels.append(channel)
-            if channel not in self.opts_channels:
-                self.opts_channels.append(channel)
-            self.log.info(f"Joined {channel}")
+            self._channels[channel] = None
+            self._opts_channels[channel] = None
+            self.log.info("Joined %s", channel)
             self.emit("join", channel, utils.username(self.username), True)
 
         if tags.get("emote-sets") and tags["emote-sets"] != self.emotes:
@@ -964,7 +1199,8 @@ class ClientBase(EventEmitter):
         self.emit("userstate", channel, tags)
 
     async def _handle_globaluserstate(self, message: IRCMessage) -> None:
-        self.globaluserstate = dict(message.tags)
+        self.globaluserstate = message.tags
+        self._gus_version += 1
         self.emit("globaluserstate", self.globaluserstate)
         emote_sets = message.tags.get("emote-sets")
         if emote_sets and emote_sets != self.emotes:
@@ -977,39 +1213,39 @@ class ClientBase(EventEmitter):
 
     async def _handle_join(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
-        username = utils.username(message.prefix.split("!")[0])
-        is_self = username == self.username
-        if is_self:
-            if channel not in self.channels:
-                self.channels.append(channel)
-            if channel not in self.opts_channels:
-                self.opts_channels.append(channel)
-        self.emit("join", channel, username, is_self)
+        username = utils.username(message.prefix.partition("!")[0])
+        if username != self.username:
+            self.emit("join", channel, username, False)
+            return
+        self._channels[channel] = None
+        self._opts_channels[channel] = None
+        self.emit("join", channel, username, True)
 
     async def _handle_part(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(0))
-        username = utils.username(message.prefix.split("!")[0])
-        is_self = username == self.username
-        if is_self:
-            self.userstate.pop(channel, None)
-            if channel in self.channels:
-                self.channels.remove(channel)
-            if channel in self.opts_channels:
-                self.opts_channels.remove(channel)
-            self.log.info(f"Left {channel}")
-            self.emit("_promisePart", None)
-        self.emit("part", channel, username, is_self)
+        username = utils.username(message.prefix.partition("!")[0])
+        if username != self.username:
+            self.emit("part", channel, username, False)
+            return
+        self.userstate.pop(channel, None)
+        self._channels.pop(channel, None)
+        self._opts_channels.pop(channel, None)
+        self.log.info("Left %s", channel)
+        self.emit("_promisePart", None)
+        self.emit("part", channel, username, True)
 
     async def _handle_names(self, message: IRCMessage) -> None:
         channel = utils.channel(message.param(2))
         names = message.param(3) or ""
-        moderators: List[str] = []
+        moderators: Set[str] = set()
         users: List[str] = []
         for name in names.split():
-            clean = utils.username(name.lstrip("@"))
+            if name[0] == "@":
+                clean = utils.username(name.lstrip("@"))
+                moderators.add(clean)
+            else:
+                clean = utils.username(name)
             users.append(clean)
-            if name.startswith("@") and clean not in moderators:
-                moderators.append(clean)
         if moderators:
             self.moderators[channel] = moderators
         self.emit("_names", channel, users)
@@ -1022,15 +1258,80 @@ class ClientBase(EventEmitter):
         channel = utils.channel(message.param(0))
         mode = message.param(1)
         username = utils.username(message.param(2))
-        mods = self.moderators.setdefault(channel, [])
+        mods = self.moderators.setdefault(channel, set())
         if mode == "+o":
-            if username not in mods:
-                mods.append(username)
+            mods.add(username)
             self.emit("mod", channel, username)
         elif mode == "-o":
-            if username in mods:
-                mods.remove(username)
+            mods.discard(username)
             self.emit("unmod", channel, username)
 
 
+# NOTICE msg-ids that need more than a table-driven emit, keyed to ``ClientBase`` handlers taking
+# ``(self, channel, msgid, msg)``. Consulted after ``_NOTICE_PROMISES`` and ``_NOTICE_MODES``.
+_NOTICE_HANDLERS: Dict[str, Callable[[ClientBase, str, str, str], None]] = {
+    **dict.fromkeys(
+        ("slow_on", "slow_off", "followers_on_zero", "followers_on", "followers_off", "host_on", "host_off"),
+        ClientBase._notice_ignored,
+    ),
+    "room_mods": ClientBase._notice_room_mods,
+    "no_mods": ClientBase._notice_no_mods,
+    "vips_success": ClientBase._notice_vips_success,
+    "no_vips": ClientBase._notice_no_vips,
+    "usage_mods": ClientBase._notice_usage_mods,
+    "usage_vips": ClientBase._notice_usage_vips,
+    "hosts_remaining": ClientBase._notice_hosts_remaining,
+    **dict.fromkeys(
+        ("no_permission", "msg_banned", "msg_room_not_found", "msg_channel_suspended", "tos_ban", "invalid_user"),
+        ClientBase._notice_rejected,
+    ),
+    **dict.fromkeys(("msg_rejected", "msg_rejected_mandatory"), ClientBase._notice_automod),
+    **dict.fromkeys(
+        (
+            "unrecognized_cmd",
+            "cmds_available",
+            "host_target_went_offline",
+            "msg_censored_broadcaster",
+            "msg_duplicate",
+            "msg_emoteonly",
+            "msg_verified_email",
+            "msg_ratelimit",
+            "msg_subsonly",
+            "msg_timedout",
+            "msg_bad_characters",
+            "msg_channel_blocked",
+            "msg_facebook",
+            "msg_followersonly",
+            "msg_followersonly_followed",
+            "msg_followersonly_zero",
+            "msg_slowmode",
+            "msg_suspended",
+            "no_help",
+            "usage_disconnect",
+            "usage_help",
+            "usage_me",
+            "unavailable_command",
+        ),
+        ClientBase._notice_plain,
+    ),
+}
+
+
+# USERNOTICE msg-ids with a dedicated event, keyed to ``ClientBase`` handlers taking
+# ``(self, channel, username, msg, tags)``. Anything else is emitted as ``usernotice``.
+_USERNOTICE_HANDLERS: Dict[str, Callable[[ClientBase, str, Any, Optional[str], Dict[str, Any]], None]] = {
+    "resub": ClientBase._usernotice_resub,
+    "sub": ClientBase._usernotice_sub,
+    "subgift": ClientBase._usernotice_subgift,
+    "anonsubgift": ClientBase._usernotice_anonsubgift,
+    "submysterygift": ClientBase._usernotice_submysterygift,
+    "anonsubmysterygift": ClientBase._usernotice_anonsubmysterygift,
+    "primepaidupgrade": ClientBase._usernotice_primepaidupgrade,
+    "giftpaidupgrade": ClientBase._usernotice_giftpaidupgrade,
+    "anongiftpaidupgrade": ClientBase._usernotice_anongiftpaidupgrade,
+    "announcement": ClientBase._usernotice_announcement,
+    "raid": ClientBase._usernotice_raid,
+}
+
+
 __all__ = ["ClientBase"]
@@ -2,17 +2,42 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from collections import defaultdict
-from typing import Any, Awaitable, Callable, DefaultDict, Dict, Iterable, List, Optional
+from types import CoroutineType
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
 
 Listener = Callable[..., Any]
 
 
+def _is_awaitable(value: Any) -> bool:
+    # Coroutines from ``async def`` listeners are by far the common case; skip inspect for them.
+    return type(value) is CoroutineType or inspect.isawaitable(value)
+
+
+def _schedule(awaitable: Awaitable[Any]) -> None:
+    asyncio.ensure_future(awaitable).add_done_callback(_report_listener_error)
+
+
+def _report_listener_error(task: "asyncio.Future[Any]") -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        task.get_loop().call_exception_handler(
+            {"message": "Unhandled error in EventEmitter listener", "exception": exc}
+        )
+
+
 class EventEmitter:
-    """A lightweight event emitter inspired by Node.js' implementation."""
+    """A lightweight event emitter inspired by Node.js' implementation.
+
+    Listener tuples are replaced rather than mutated, so emitting iterates them without copying.
+    """
+
+    __slots__ = ("_events", "_fanout", "_max_listeners", "__weakref__")
 
     def __init__(self) -> None:
-        self._events: DefaultDict[str, List[Listener]] = defaultdict(list)
+        self._events: Dict[str, Tuple[Listener, ...]] = {}
+        self._fanout: Dict[Tuple[str, ...], Tuple[Listener, ...]] = {}
         self._max_listeners: int = 0
 
     def set_max_listeners(self, n: int) -> "EventEmitter":
@@ -20,10 +45,11 @@ class EventEmitter:
         return self
 
     def on(self, event: str, listener: Listener) -> "EventEmitter":
-        listeners = self._events[event]
+        listeners = self._events.get(event, ())
         if self._max_listeners and len(listeners) >= self._max_listeners:
             raise RuntimeError(f"Max listeners exceeded for event '{event}'")
-        listeners.append(listener)
+        self._events[event] = listeners + (listener,)
+        self._fanout.clear()
         return self
 
     def once(self, event: str, listener: Listener) -> "EventEmitter":
@@ -38,11 +64,15 @@ class EventEmitter:
         if not listeners:
             return self
         try:
-            listeners.remove(listener)
+            index = listeners.index(listener)
         except ValueError:
             return self
-        if not listeners:
-            self._events.pop(event, None)
+        self._fanout.clear()
+        remaining = listeners[:index] + listeners[index + 1 :]
+        if remaining:
+            self._events[event] = remaining
+        else:
+            del self._events[event]
         return self
 
     def remove_all_listeners(self, event: Optional[str] = None) -> "EventEmitter":
@@ -50,16 +80,17 @@ class EventEmitter:
             self._events.clear()
         else:
             self._events.pop(event, None)
+        self._fanout.clear()
         return self
 
     def listeners(self, event: str) -> Iterable[Listener]:
-        return tuple(self._events.get(event, ()))
+        return self._events.get(event, ())
 
     def listener_count(self, event: str) -> int:
         return len(self._events.get(event, ()))
 
     def emit(self, event: str, *args: Any, **kwargs: Any) -> bool:
-        listeners = list(self._events.get(event, ()))
+        listeners = self._events.get(event, ())
         if not listeners:
             if event == "error":
                 error = args[0] if args else RuntimeError('Uncaught "error" event.')
@@ -68,27 +99,41 @@ class EventEmitter:
 
         for listener in listeners:
             result = listener(*args, **kwargs)
-            if inspect.isawaitable(result):
-                asyncio.create_task(self._ensure_future(result))
+            if result is not None and _is_awaitable(result):
+                _schedule(result)
         return True
 
     def emit_many(
         self, events: Iterable[str], payloads: Iterable[Iterable[Any]]
     ) -> None:
-        payloads_list = list(payloads)
-        for index, event in enumerate(events):
-            payload = payloads_list[index] if index < len(payloads_list) else payloads_list[-1]
+        """Emit ``events`` in order, pairing each with the next payload; the last payload repeats."""
+        remaining = iter(payloads)
+        payload: Iterable[Any] = ()
+        for event in events:
+            payload = next(remaining, payload)
             self.emit(event, *payload)
 
-    @staticmethod
-    async def _ensure_future(awaitable: Awaitable[Any]) -> None:
-        try:
-            await awaitable
-        except Exception as exc:  # pragma: no cover - best effort logging
-            loop = asyncio.get_running_loop()
-            loop.call_exception_handler(
-                {"message": "Unhandled error in EventEmitter listener", "exception": exc}
-            )
+    def emit_pair(
+        self, first: str, first_args: Iterable[Any], second: str, second_args: Iterable[Any]
+    ) -> None:
+        """Emit two events back to back, each with its own payload."""
+        self.emit(first, *first_args)
+        self.emit(second, *second_args)
+
+    def emit_fanout(self, events: Tuple[str, ...], *args: Any) -> bool:
+        """Emit the same payload to every listener of ``events`` in one pass.
+
+        The combined listener list is cached per events tuple until a listener is added or removed.
+        """
+        listeners = self._fanout.get(events)
+        if listeners is None:
+            listeners = tuple(listener for event in events for listener in self._events.get(event, ()))
+            self._fanout[events] = listeners
+        for listener in listeners:
+            result = listener(*args)
+            if result is not None and _is_awaitable(result):
+                _schedule(result)
+        return bool(listeners)
 
 
 __all__ = ["EventEmitter"]
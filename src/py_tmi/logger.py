@@ -15,6 +15,7 @@ class Logger:
         "error": logging.ERROR,
         "fatal": logging.CRITICAL,
     }
+    _NAMES: Dict[int, str] = {value: name for name, value in _LEVELS.items()}
 
     def __init__(self, name: str = "py_tmi") -> None:
         logging.addLevelName(self._LEVELS["trace"], "TRACE")
@@ -34,10 +35,11 @@ class Logger:
 
     def get_level(self) -> str:
         current = self._logger.getEffectiveLevel()
-        for name, value in self._LEVELS.items():
-            if value == current:
-                return name
-        return logging.getLevelName(current)
+        return self._NAMES.get(current) or logging.getLevelName(current)
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Whether the underlying logger would emit a record at ``level``."""
+        return self._logger.isEnabledFor(self._LEVELS.get(level.lower(), logging.INFO))
 
     def trace(self, message: str, *args, **kwargs) -> None:
         self._logger.log(self._LEVELS["trace"], message, *args, **kwargs)
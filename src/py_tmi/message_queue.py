@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional, Tuple
 
 
 @dataclass
 class QueueItem:
-    callback: Callable[[], Awaitable[None]]
+    callback: Callable[..., Awaitable[None]]
     delay: Optional[float]
+    args: Tuple[Any, ...] = ()
 
 
 class MessageQueue:
@@ -18,22 +19,40 @@ class MessageQueue:
         self._default_delay = default_delay
         self._queue: "asyncio.Queue[QueueItem]" = asyncio.Queue()
         self._worker: Optional[asyncio.Task[None]] = None
-        self._loop = loop or asyncio.get_event_loop()
+        # Without an explicit loop the worker is started on whichever loop is running at the first add().
+        self._loop = loop
 
     async def add(self, callback: Callable[[], Awaitable[None]], *, delay: Optional[float] = None) -> None:
         await self._queue.put(QueueItem(callback=callback, delay=delay))
+        self._ensure_worker()
+
+    async def add_call(
+        self, callback: Callable[..., Awaitable[None]], *args: Any, delay: Optional[float] = None
+    ) -> None:
+        """Queue ``callback(*args)`` without wrapping it in a closure first."""
+        await self._queue.put(QueueItem(callback=callback, delay=delay, args=args))
+        self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
         if self._worker is None or self._worker.done():
-            self._worker = self._loop.create_task(self._run())
+            loop = self._loop or asyncio.get_running_loop()
+            self._worker = loop.create_task(self._run())
 
     async def _run(self) -> None:
+        # Items are spaced by the time between callback starts, so a slow send counts towards the delay.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         try:
             while True:
                 item = await self._queue.get()
+                wait = deadline - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                deadline = loop.time() + (item.delay or self._default_delay)
                 try:
-                    await item.callback()
+                    await item.callback(*item.args)
                 finally:
                     self._queue.task_done()
-                await asyncio.sleep(item.delay or self._default_delay)
         except asyncio.CancelledError:
             raise
 
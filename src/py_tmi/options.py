@@ -55,4 +55,5 @@ class ClientOptions:
     global_default_channel: str = "#tmijs"
     skip_membership: bool = False
     join_existing_channels: bool = True
+    use_uvloop: bool = False
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from sys import intern
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from . import utils
@@ -24,61 +26,115 @@ class IRCMessage:
             return default
 
 
-def _parse_complex_tag(
-    tags: Dict[str, object], key: str, separator_a: str = ",", separator_b: str = "/", separator_c: Optional[str] = None
-) -> Dict[str, object]:
+@lru_cache(maxsize=1024)
+def _split_pairs(raw: str, separator_a: str, separator_b: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    # Badge strings repeat across a chat (same users, same badge sets), so split each one once.
+    pairs = []
+    for part in raw.split(separator_a):
+        segments = part.split(separator_b)
+        pairs.append((segments[0], (segments[1] or None) if len(segments) > 1 else None))
+    return tuple(pairs)
+
+
+def _complex_tag_raw(tags: Dict[str, object], key: str) -> Optional[str]:
+    """Return the raw string to parse for ``key``, or ``None`` once the tag is settled as is."""
     raw = tags.get(key)
     if raw is None:
-        return tags
+        return None
 
     if raw is True:
         tags[key] = None
         tags[f"{key}-raw"] = None
-        return tags
+        return None
 
     if not isinstance(raw, str):
         tags[key] = {}
         tags[f"{key}-raw"] = None
-        return tags
+        return None
 
     tags[f"{key}-raw"] = raw
-    parsed: Dict[str, object] = {}
+    return raw
 
-    for part in raw.split(separator_a):
-        segments = part.split(separator_b)
-        key_segment = segments[0]
-        value_segment = segments[1] if len(segments) > 1 else None
-        if separator_c is not None and value_segment:
-            parsed[key_segment] = value_segment.split(separator_c)
-        else:
-            parsed[key_segment] = value_segment or None
-    tags[key] = parsed
+
+def _parse_kv_pairs(tags: Dict[str, object], key: str) -> Dict[str, object]:
+    raw = _complex_tag_raw(tags, key)
+    if raw is not None:
+        # Values are plain strings, so a shallow copy of the cached pairs is safe to hand out.
+        tags[key] = dict(_split_pairs(raw, ",", "/"))
+    return tags
+
+
+def _parse_kv_list(tags: Dict[str, object], key: str) -> Dict[str, object]:
+    raw = _complex_tag_raw(tags, key)
+    if raw is not None:
+        parsed: Dict[str, object] = {}
+        for part in raw.split("/"):
+            segments = part.split(":")
+            value = segments[1] if len(segments) > 1 else None
+            parsed[segments[0]] = value.split(",") if value else None
+        tags[key] = parsed
     return tags
 
 
 def parse_badges(tags: Dict[str, object]) -> Dict[str, object]:
-    return _parse_complex_tag(tags, "badges")
+    return _parse_kv_pairs(tags, "badges")
 
 
 def parse_badge_info(tags: Dict[str, object]) -> Dict[str, object]:
-    return _parse_complex_tag(tags, "badge-info")
+    return _parse_kv_pairs(tags, "badge-info")
 
 
 def parse_emotes(tags: Dict[str, object]) -> Dict[str, object]:
-    return _parse_complex_tag(tags, "emotes", "/", ":", ",")
+    return _parse_kv_list(tags, "emotes")
+
+
+@lru_cache(maxsize=4096)
+def _emote_pattern(code: str, whole_token: bool) -> Optional["re.Pattern[str]"]:
+    text = utils.unescape_html(code)
+    if any(char.isspace() for char in text):
+        # A whitespace-delimited token can never contain the code.
+        return None
+    escaped = re.escape(text)
+    if whole_token:
+        return re.compile(rf"(?<!\S){escaped}(?!\S)") if text else None
+    # Match each token holding the code at its start or after a word boundary, and ending at a
+    # word boundary or the token end; one finditer over the message replaces a search per token.
+    return re.compile(rf"(?<!\S)(?=(?:\S*?\b)?{escaped}(?:\b|(?!\S)))\S+")
+
+
+def _collect_emote(
+    pattern: Optional["re.Pattern[str]"], message: str, emote_id: str, accumulator: Dict[str, List[Tuple[int, int]]]
+) -> None:
+    if pattern is None:
+        return
+    positions = [(match.start(), match.end() - 1) for match in pattern.finditer(message)]
+    if positions:
+        accumulator.setdefault(emote_id, []).extend(positions)
 
 
 def emote_regex(message: str, code: str, emote_id: str, accumulator: Dict[str, List[Tuple[int, int]]]) -> None:
-    pattern = re.compile(rf"(\b|^|\s){re.escape(utils.unescape_html(code))}(\b|$|\s)")
-    for match in NONSPACE_REGEX.finditer(message):
-        if pattern.search(match.group(0)):
-            accumulator.setdefault(emote_id, []).append((match.start(), match.end() - 1))
+    _collect_emote(_emote_pattern(code, False), message, emote_id, accumulator)
 
 
 def emote_string(message: str, code: str, emote_id: str, accumulator: Dict[str, List[Tuple[int, int]]]) -> None:
+    _collect_emote(_emote_pattern(code, True), message, emote_id, accumulator)
+
+
+def emote_scan(message: str, emotes: Dict[str, str], accumulator: Dict[str, List[Tuple[int, int]]]) -> None:
+    """Record the spans of every ``emote_id -> code`` in ``emotes`` with one pass over ``message``.
+
+    Matches exactly like calling ``emote_string`` per emote, but ids are added to ``accumulator``
+    in order of their first appearance in the message.
+    """
+    by_code: Dict[str, List[str]] = {}
+    for emote_id, code in emotes.items():
+        by_code.setdefault(utils.unescape_html(code), []).append(emote_id)
     for match in NONSPACE_REGEX.finditer(message):
-        if match.group(0) == utils.unescape_html(code):
-            accumulator.setdefault(emote_id, []).append((match.start(), match.end() - 1))
+        emote_ids = by_code.get(match.group())
+        if emote_ids:
+            span = (match.start(), match.end() - 1)
+            for emote_id in emote_ids:
+                accumulator.setdefault(emote_id, []).append(span)
 
 
 def transform_emotes(emotes: Dict[str, Iterable[Tuple[int, int]]]) -> str:
@@ -101,24 +157,23 @@ def form_tags(tags: Optional[Dict[str, object]]) -> Optional[str]:
 
 
 def parse_message(data: str) -> Optional[IRCMessage]:
-    message = IRCMessage(raw=data)
-    position = 0
     length = len(data)
-
     if length == 0:
         return None
 
+    message = IRCMessage(raw=data)
+    position = 0
+
     if data[0] == "@":
         next_space = data.find(" ")
         if next_space == -1:
             return None
-        raw_tags = data[1:next_space].split(";")
-        for tag in raw_tags:
-            if "=" in tag:
-                key, value = tag.split("=", 1)
-                message.tags[key] = value or True
-            else:
-                message.tags[tag] = True
+        # Tag keys and commands come from a small fixed vocabulary; interning them lets every
+        # message share one key object and makes dict lookups hit the identity fast path.
+        tags = message.tags
+        for tag in data[1:next_space].split(";"):
+            key, _, value = tag.partition("=")
+            tags[intern(key)] = value or True
         position = next_space + 1
 
     while position < length and data[position] == " ":
@@ -138,10 +193,10 @@ def parse_message(data: str) -> Optional[IRCMessage]:
 
     next_space = data.find(" ", position)
     if next_space == -1:
-        message.command = data[position:]
+        message.command = intern(data[position:])
         return message
 
-    message.command = data[position:next_space]
+    message.command = intern(data[position:next_space])
     position = next_space + 1
 
     while position < length:
@@ -170,4 +225,5 @@ __all__ = [
     "form_tags",
     "emote_regex",
     "emote_string",
+    "emote_scan",
 ]
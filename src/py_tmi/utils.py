@@ -3,15 +3,21 @@ from __future__ import annotations
 import asyncio
 import random
 import re
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Optional
 
 ACTION_MESSAGE_REGEX = re.compile(r"^\u0001ACTION ([^\u0001]+)\u0001$")
-JUSTINFAN_REGEX = re.compile(r"^(justinfan)(\d+)$")
-UNESCAPE_IRC_REGEX = re.compile(r"\\([sn:r\\])")
-ESCAPE_IRC_REGEX = re.compile(r"([ \n;\r\\])")
-TOKEN_REGEX = re.compile(r"^oauth:", re.IGNORECASE)
+LEADING_WHITESPACE_REGEX = re.compile(r"\s*")
 IRC_ESCAPED_CHARS: Dict[str, str] = {"s": " ", "n": "", ":": ";", "r": ""}
 IRC_UNESCAPED_CHARS: Dict[str, str] = {" ": "s", "\n": "n", ";": ":", "\r": "r", "\\": "\\"}
+HTML_ESCAPED_ENTITIES: Dict[str, str] = {
+    "\\&amp\\;": "&",
+    "\\&lt\\;": "<",
+    "\\&gt\\;": ">",
+    "\\&quot\\;": '"',
+    "\\&#039\\;": "'",
+}
+UNESCAPE_HTML_REGEX = re.compile("|".join(re.escape(entity) for entity in HTML_ESCAPED_ENTITIES))
 
 
 def has_own(obj: Dict[str, Any], key: str) -> bool:
@@ -42,15 +48,18 @@ def justinfan() -> str:
     return f"justinfan{random.randint(1_000, 89_999)}"
 
 
+@lru_cache(maxsize=4096)
 def is_justinfan(username: str) -> bool:
-    return bool(JUSTINFAN_REGEX.match(username or ""))
+    return bool(username) and username.startswith("justinfan") and username[9:].isdecimal()
 
 
+@lru_cache(maxsize=4096)
 def channel(value: Optional[str]) -> str:
     normalized = (value or "").lower()
     return normalized if normalized.startswith("#") else f"#{normalized}"
 
 
+@lru_cache(maxsize=4096)
 def username(value: Optional[str]) -> str:
     normalized = (value or "").lower()
     return normalized[1:] if normalized.startswith("#") else normalized
@@ -59,7 +68,7 @@ def username(value: Optional[str]) -> str:
 def token(value: Optional[str]) -> str:
     if not value:
         return ""
-    return TOKEN_REGEX.sub("", value)
+    return value[6:] if value[:6].lower() == "oauth:" else value
 
 
 def password(value: Optional[str]) -> str:
@@ -71,42 +80,62 @@ def action_message(message: str) -> Optional[re.Match[str]]:
     return ACTION_MESSAGE_REGEX.match(message)
 
 
+def action_text(message: str) -> Optional[str]:
+    """Return the text of a CTCP ``ACTION`` (``/me``) message, or ``None`` for regular messages.
+
+    Matches the same messages as :func:`action_message` without going through the regex engine.
+    """
+    if len(message) > 9 and message[-1] == "\u0001" and message.startswith("\u0001ACTION "):
+        text = message[8:-1]
+        if "\u0001" not in text:
+            return text
+    return None
+
+
 def unescape_html(value: str) -> str:
-    return (
-        value.replace("\\&amp\\;", "&")
-        .replace("\\&lt\\;", "<")
-        .replace("\\&gt\\;", ">")
-        .replace("\\&quot\\;", '"')
-        .replace("\\&#039\\;", "'")
-    )
+    if "\\&" not in value:
+        return value
+    return UNESCAPE_HTML_REGEX.sub(lambda match: HTML_ESCAPED_ENTITIES[match.group(0)], value)
+
+
+def _unescape_irc_pairs(value: str) -> str:
+    return value.replace("\\s", " ").replace("\\n", "").replace("\\:", ";").replace("\\r", "")
 
 
 def unescape_irc(value: Optional[str]) -> Optional[str]:
     if not value or "\\" not in value:
         return value
-    return UNESCAPE_IRC_REGEX.sub(lambda match: IRC_ESCAPED_CHARS.get(match.group(1), match.group(1)), value)
+    if "\\\\" not in value:
+        return _unescape_irc_pairs(value)
+    # Escaped backslashes pair up left to right, so unescape the pieces between them.
+    return "\\".join(_unescape_irc_pairs(piece) for piece in value.split("\\\\"))
 
 
 def escape_irc(value: Optional[str]) -> Optional[str]:
     if not value:
         return value
-
-    def replacer(match: re.Match[str]) -> str:
-        char = match.group(1)
-        return f"\\{IRC_UNESCAPED_CHARS.get(char, char)}"
-
-    return ESCAPE_IRC_REGEX.sub(replacer, value)
+    # Backslashes first, so the escapes added afterwards are not doubled.
+    return (
+        value.replace("\\", "\\\\")
+        .replace(" ", "\\s")
+        .replace(";", "\\:")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
 
 
 def paginate_message(message: str, limit: int = 500) -> Iterable[str]:
-    text = message
-    while len(text) > limit:
-        split_at = text.rfind(" ", 0, limit)
+    # Walk an index through the original string; re-slicing the remainder for every chunk
+    # copied the rest of the message each time.
+    start = 0
+    length = len(message)
+    while length - start > limit:
+        split_at = message.rfind(" ", start, start + limit)
         if split_at == -1:
-            split_at = limit
-        yield text[:split_at]
-        text = text[split_at:].lstrip()
-    yield text
+            split_at = start + limit
+        yield message[start:split_at]
+        start = LEADING_WHITESPACE_REGEX.match(message, split_at).end()
+    yield message[start:]
 
 
 __all__ = [
@@ -120,6 +149,7 @@ __all__ = [
     "token",
     "password",
     "action_message",
+    "action_text",
     "escape_irc",
     "unescape_irc",
     "unescape_html",
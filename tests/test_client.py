@@ -0,0 +1,10 @@
+import inspect
+
+from py_tmi.client import _SIMPLE_COMMANDS, Client
+
+
+def test_simple_commands_take_only_a_channel():
+    for name, _, _ in _SIMPLE_COMMANDS:
+        method = getattr(Client, name)
+        assert list(inspect.signature(method).parameters) == ["self", "channel"]
+        assert method.__qualname__ == f"Client.{name}"
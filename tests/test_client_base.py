@@ -0,0 +1,580 @@
+import asyncio
+
+from py_tmi.client_base import ClientBase, _IrcProtocol, _tag_int
+from py_tmi.exceptions import CommandTimedOut, NotConnectedError
+from py_tmi.options import ClientOptions, ConnectionOptions
+from py_tmi.parser import parse_message
+
+
+class FakeTransport:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def is_closing(self):
+        return False
+
+
+class FakeProtocol:
+    async def drain(self):
+        pass
+
+
+def test_send_raw_coalesces_pending_lines():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    writer = FakeTransport()
+    client._transport = writer
+    client._protocol = FakeProtocol()
+
+    async def runner():
+        task = loop.create_task(client._writer_loop())
+        await asyncio.gather(*(client._send_raw(f"PRIVMSG #chan :{i}") for i in range(3)))
+        task.cancel()
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert writer.writes == [b"PRIVMSG #chan :0\r\nPRIVMSG #chan :1\r\nPRIVMSG #chan :2\r\n"]
+
+
+def test_static_commands_use_pre_encoded_wire():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    writer = FakeTransport()
+    client._transport = writer
+    client._protocol = FakeProtocol()
+
+    async def runner():
+        task = loop.create_task(client._writer_loop())
+        await client._send_command("#chan", "/clear")
+        await client._command_queue.join()
+        client._command_queue.stop()
+        task.cancel()
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert writer.writes == [b"PRIVMSG #chan :/clear\r\n"]
+
+
+def feed(protocol, data):
+    buffer = protocol.get_buffer(len(data))
+    buffer[: len(data)] = data
+    protocol.buffer_updated(len(data))
+
+
+def test_protocol_splits_lines_across_reads():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    lines = asyncio.Queue()
+
+    async def runner():
+        protocol = _IrcProtocol(lines)
+        feed(protocol, b"PING :tmi.twitch.tv\r\n:a!a@a PRIV")
+        feed(protocol, b"MSG #chan :hi\r")
+        feed(protocol, b"\n\r\n:b!b@b PRIVMSG #chan :yo\n")
+        protocol.connection_lost(None)
+
+    loop.run_until_complete(runner())
+    received = []
+    while not lines.empty():
+        received.append(lines.get_nowait())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [
+        b"PING :tmi.twitch.tv",
+        b":a!a@a PRIVMSG #chan :hi",
+        b":b!b@b PRIVMSG #chan :yo",
+        None,
+    ]
+
+
+def test_notice_table_settles_promise():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    client.on("notice", lambda *args: received.append(("notice",) + args))
+    client.on("_promiseBan", lambda *args: received.append(("_promiseBan",) + args))
+    client.on("subscribers", lambda *args: received.append(("subscribers",) + args))
+
+    async def runner():
+        await client._handle_notice(parse_message("@msg-id=bad_ban_self :tmi.twitch.tv NOTICE #chan :nope"))
+        await client._handle_notice(parse_message("@msg-id=subs_on :tmi.twitch.tv NOTICE #chan :on"))
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [
+        ("notice", "#chan", "bad_ban_self", "nope"),
+        ("_promiseBan", "bad_ban_self"),
+        ("subscribers", "#chan", True),
+    ]
+
+
+def test_handle_message_normalizes_tags():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    message = parse_message(r"@mod=1;subscriber=0;bits=1;display-name=a\sb;flag :tmi.twitch.tv FOO #chan")
+
+    loop.run_until_complete(client._handle_message(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert message.tags["mod"] is True
+    assert message.tags["subscriber"] is False
+    assert message.tags["bits"] == "1"
+    assert message.tags["display-name"] == "a b"
+    assert message.tags["flag"] is None
+
+
+def test_reconnects_after_connection_drop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    connections = []
+
+    async def handler(reader, writer):
+        connections.append(writer)
+        if len(connections) > 1:
+            await reader.read()
+        writer.close()
+        await writer.wait_closed()
+
+    async def runner():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        options = ClientOptions(
+            connection=ConnectionOptions(server="127.0.0.1", port=port, secure=False, reconnect_interval=0.01)
+        )
+        client = ClientBase(options=options, loop=loop)
+        reconnected = loop.create_future()
+        client.on("reconnected", lambda *args: reconnected.set_result(args))
+        await client.connect()
+        result = await asyncio.wait_for(reconnected, 5)
+        await client.disconnect()
+        server.close()
+        await server.wait_closed()
+        return result
+
+    result = loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert result[0] == "127.0.0.1"
+    assert len(connections) == 2
+
+
+def test_jtv_hosted_count():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    hosted = []
+    client.on("hosted", lambda *args: hosted.append(args))
+    message = parse_message(":jtv!jtv@jtv.tmi.twitch.tv PRIVMSG #chan :Someone is now hosting you for 12 viewers.")
+
+    loop.run_until_complete(client._handle_message(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert hosted == [("#chan", "someone", 12, False)]
+
+
+def test_privmsg_emits_chat_and_redeem():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    client.on("chat", lambda channel, tags, msg, self_: received.append(("chat", msg)))
+    client.on("message", lambda channel, tags, msg, self_: received.append(("message", msg)))
+    client.on("redeem", lambda channel, username, reward, tags, msg: received.append(("redeem", reward)))
+    message = parse_message("@custom-reward-id=abc :a!a@a.tmi.twitch.tv PRIVMSG #chan :hello")
+
+    loop.run_until_complete(client._handle_message(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [("redeem", "abc"), ("chat", "hello"), ("message", "hello")]
+
+
+def test_server_ping_is_answered_immediately():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    writer = FakeTransport()
+    client._transport = writer
+    client._protocol = FakeProtocol()
+
+    loop.run_until_complete(client._handle_message(parse_message("PING :tmi.twitch.tv")))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert writer.writes == [b"PONG :tmi.twitch.tv\r\n"]
+
+
+def test_raw_message_receives_parsed_message():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    client.on("raw_message", received.append)
+    message = parse_message("@mod=1 :tmi.twitch.tv FOO #chan")
+
+    loop.run_until_complete(client._handle_message(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [message]
+
+
+def test_rejection_notice_fails_pending_promises():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    client.on("_promiseTimeout", lambda *args: received.append(("_promiseTimeout",) + args))
+    client.on("_promiseWhisper", lambda *args: received.append(("_promiseWhisper",) + args))
+
+    message = parse_message("@msg-id=no_permission :tmi.twitch.tv NOTICE #chan :denied")
+    loop.run_until_complete(client._handle_notice(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [("_promiseTimeout", "no_permission", "#chan"), ("_promiseWhisper", "no_permission", "#chan")]
+
+
+def test_own_join_and_part_track_channels():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    client.username = "bot"
+
+    async def runner():
+        for line in ("JOIN #a", "JOIN #b", "JOIN #a", "PART #a"):
+            await client._handle_message(parse_message(f":bot!bot@bot.tmi.twitch.tv {line}"))
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert client.channels == ["#b"]
+    assert client.opts_channels == ["#b"]
+
+
+def test_names_reply_records_moderators():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    names = []
+    client.on("_names", lambda channel, users: names.append((channel, users)))
+    message = parse_message(":bot.tmi.twitch.tv 353 bot = #chan :@Mod viewer @mod Other")
+
+    loop.run_until_complete(client._handle_message(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert names == [("#chan", ["mod", "viewer", "mod", "other"])]
+    assert client.moderators["#chan"] == {"mod"}
+
+
+def test_hosttarget_payload():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    client.on("hosting", lambda *args: received.append(("hosting",) + args))
+    client.on("unhost", lambda *args: received.append(("unhost",) + args))
+
+    async def runner():
+        for payload in ("other 5", "- 3", "other x", "other"):
+            await client._handle_hosttarget(parse_message(f":tmi.twitch.tv HOSTTARGET #chan :{payload}"))
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [
+        ("hosting", "#chan", "other", 5),
+        ("unhost", "#chan", 3),
+        ("hosting", "#chan", "other", 0),
+        ("hosting", "#chan", "other", 0),
+    ]
+
+
+def test_moderators_list_is_sorted():
+    loop = asyncio.new_event_loop()
+    client = ClientBase(loop=loop)
+    client.moderators["#chan"] = {"zed", "amy"}
+    loop.close()
+
+    assert client.moderators_list("Chan") == ["amy", "zed"]
+    assert client.moderators_list("#other") == []
+
+
+def test_other_users_join_and_part_leave_state_alone():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    client.username = "bot"
+    client.channels = ["#a"]
+    client.userstate["#a"] = {"mod": False}
+    received = []
+    client.on("join", lambda *args: received.append(("join",) + args))
+    client.on("part", lambda *args: received.append(("part",) + args))
+
+    async def runner():
+        for line in ("JOIN #a", "PART #a"):
+            await client._handle_message(parse_message(f":viewer!viewer@viewer.tmi.twitch.tv {line}"))
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [("join", "#a", "viewer", False), ("part", "#a", "viewer", False)]
+    assert client.channels == ["#a"]
+    assert "#a" in client.userstate
+
+
+def test_roomstate_slow_and_followers_events():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    for event in ("slow", "slowmode", "_promiseSlow", "followersonly", "_promiseFollowersoff"):
+        client.on(event, lambda *args, event=event: received.append((event,) + args))
+
+    message = parse_message("@slow=30;followers-only=-1 :tmi.twitch.tv ROOMSTATE #chan")
+    loop.run_until_complete(client._handle_message(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [
+        ("slow", "#chan", True, 30),
+        ("slowmode", "#chan", True, 30),
+        ("_promiseSlow", None),
+        ("followersonly", "#chan", False, 0),
+        ("_promiseFollowersoff", None),
+    ]
+
+
+def test_clearchat_timeout_duration_is_parsed_once():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    client.on("timeout", lambda channel, username, reason, seconds, tags: received.append((username, seconds)))
+    _tag_int.cache_clear()
+
+    async def runner():
+        for user in ("a", "b"):
+            await client._handle_message(parse_message(f"@ban-duration=600 :tmi.twitch.tv CLEARCHAT #chan :{user}"))
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == [("a", 600), ("b", 600)]
+    assert _tag_int.cache_info().hits == 1
+
+
+def test_full_roomstate_snapshot_only_emits_roomstate():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+    received = []
+    for event in ("roomstate", "slow", "followersonly"):
+        client.on(event, lambda *args, event=event: received.append(event))
+
+    message = parse_message("@followers-only=-1;slow=30;subs-only=0 :tmi.twitch.tv ROOMSTATE #chan")
+    loop.run_until_complete(client._handle_message(message))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert received == ["roomstate"]
+
+
+def test_disconnect_during_reconnect_backoff_stops_reconnecting():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    connections = []
+
+    async def handler(reader, writer):
+        connections.append(writer)
+        writer.close()
+        await writer.wait_closed()
+
+    async def runner():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        options = ClientOptions(
+            connection=ConnectionOptions(server="127.0.0.1", port=port, secure=False, reconnect_interval=0.2)
+        )
+        client = ClientBase(options=options, loop=loop)
+        dropped = loop.create_future()
+        client.on("disconnected", lambda *args: dropped.done() or dropped.set_result(args))
+        await client.connect()
+        await asyncio.wait_for(dropped, 5)
+        await client.disconnect()
+        await asyncio.sleep(0.4)
+        server.close()
+        await server.wait_closed()
+        return client
+
+    client = loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert len(connections) == 1
+    assert not client.reconnecting
+
+
+def test_reconnect_retries_after_failed_rejoin():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    connections = []
+    attempts = []
+
+    class FlakyJoinClient(ClientBase):
+        __slots__ = ()
+
+        async def join(self, channel):
+            attempts.append(channel)
+            if len(attempts) == 1:
+                raise CommandTimedOut("Timed out waiting for event '_promiseJoin'.")
+            if len(attempts) == 2:
+                # Dropped while re-joining, without the join itself failing.
+                self._transport.close()
+                await asyncio.sleep(0.05)
+            return (channel,)
+
+    async def handler(reader, writer):
+        connections.append(writer)
+        if len(connections) > 1:
+            await reader.read()
+        writer.close()
+        await writer.wait_closed()
+
+    async def runner():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        options = ClientOptions(
+            connection=ConnectionOptions(server="127.0.0.1", port=port, secure=False, reconnect_interval=0.01)
+        )
+        client = FlakyJoinClient(options=options, loop=loop)
+        errors = []
+        client.on("error", errors.append)
+        reconnected = loop.create_future()
+        client.on("reconnected", lambda *args: reconnected.set_result(args))
+        await client.connect()
+        client.opts_channels = ["#chan"]
+        await asyncio.wait_for(reconnected, 5)
+        connected = client.is_connected
+        await client.disconnect()
+        server.close()
+        await server.wait_closed()
+        return errors, connected
+
+    errors, connected = loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert connected
+    assert len(attempts) == 3
+    assert len(connections) == 4
+    assert [type(error) for error in errors] == [CommandTimedOut]
+
+
+def test_pending_sends_fail_when_writer_is_cancelled():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = ClientBase(loop=loop)
+
+    class StalledProtocol:
+        async def drain(self):
+            await asyncio.sleep(10)
+
+        async def wait_closed(self):
+            pass
+
+    class ClosingTransport(FakeTransport):
+        def close(self):
+            pass
+
+    client._transport = ClosingTransport()
+    client._protocol = StalledProtocol()
+
+    async def runner():
+        client._write_task = loop.create_task(client._writer_loop())
+        sends = [loop.create_task(client._send_raw(f"PRIVMSG #chan :{i}")) for i in range(3)]
+        await asyncio.sleep(0.01)
+        await client._close("test")
+        return await asyncio.wait_for(asyncio.gather(*sends, return_exceptions=True), 1)
+
+    results = loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert [type(result) for result in results] == [NotConnectedError] * 3
+
+
+def _count_disconnects(first_line):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    connections = []
+
+    async def handler(reader, writer):
+        connections.append(writer)
+        if len(connections) == 1:
+            writer.write(first_line)
+            await writer.drain()
+        await reader.read()
+        writer.close()
+
+    async def runner():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        options = ClientOptions(
+            connection=ConnectionOptions(server="127.0.0.1", port=port, secure=False, reconnect_interval=0.05)
+        )
+        client = ClientBase(options=options, loop=loop)
+        events = []
+        client.on("disconnected", lambda reason: events.append(("disconnected", reason)))
+        client.on("reconnected", lambda *args: events.append(("reconnected",)))
+        await client.connect()
+        await asyncio.sleep(0.5)
+        if client.is_connected:
+            await client.disconnect()
+        server.close()
+        await server.wait_closed()
+        return events
+
+    events = loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+    return events
+
+
+def test_server_reconnect_emits_disconnected_once():
+    events = _count_disconnects(b":tmi.twitch.tv RECONNECT\r\n")
+    assert events == [("disconnected", "Server requested reconnect"), ("reconnected",)]
+
+
+def test_auth_failure_emits_disconnected_once():
+    events = _count_disconnects(b":tmi.twitch.tv NOTICE * :Login authentication failed\r\n")
+    assert events == [("disconnected", "Login authentication failed")]
+
+
+def test_repeated_invalid_nick_notice_keeps_short_reason():
+    events = _count_disconnects(b":tmi.twitch.tv NOTICE * :Invalid NICK (Invalid NICK)\r\n")
+    assert events == [("disconnected", "Invalid NICK.")]
+    events = _count_disconnects(b":tmi.twitch.tv NOTICE * :Invalid NICK; Login unsuccessful\r\n")
+    assert events == [("disconnected", "Invalid NICK; Login unsuccessful")]
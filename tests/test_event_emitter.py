@@ -35,3 +35,87 @@ def test_emit_many_dispatches_payloads():
     emitter.emit_many(["first", "second"], [(1,), (2,)])
 
     assert results == [("first", (1,)), ("second", (2,))]
+
+
+def test_emit_fanout_tracks_listener_changes():
+    emitter = EventEmitter()
+    results = []
+
+    def on_second(*args):
+        results.append(("second", args))
+
+    emitter.on("first", lambda *args: results.append(("first", args)))
+    emitter.on("second", on_second)
+
+    assert emitter.emit_fanout(("first", "second"), 1) is True
+    emitter.off("second", on_second)
+    emitter.emit_fanout(("first", "second"), 2)
+
+    assert results == [("first", (1,)), ("second", (1,)), ("first", (2,))]
+
+
+def test_emit_pair_sends_each_payload():
+    emitter = EventEmitter()
+    results = []
+    emitter.on("first", lambda *args: results.append(("first", args)))
+    emitter.on("second", lambda *args: results.append(("second", args)))
+
+    emitter.emit_pair("first", (1, 2), "second", (3,))
+
+    assert results == [("first", (1, 2)), ("second", (3,))]
+
+
+def test_off_during_emit_keeps_current_dispatch():
+    emitter = EventEmitter()
+    results = []
+
+    def first():
+        results.append("first")
+        emitter.off("tick", second)
+
+    def second():
+        results.append("second")
+
+    emitter.on("tick", first)
+    emitter.on("tick", second)
+    emitter.emit("tick")
+    emitter.emit("tick")
+
+    assert results == ["first", "second", "first"]
+    assert emitter.listener_count("tick") == 1
+
+
+def test_emit_many_repeats_last_payload():
+    emitter = EventEmitter()
+    results = []
+    for event in ("a", "b", "c"):
+        emitter.on(event, lambda *args, event=event: results.append((event, args)))
+
+    emitter.emit_many(["a", "b", "c"], [(1,), (2,)])
+
+    assert results == [("a", (1,)), ("b", (2,)), ("c", (2,))]
+
+
+def test_async_listener_errors_reach_exception_handler():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    emitter = EventEmitter()
+    contexts = []
+    loop.set_exception_handler(lambda _, context: contexts.append(context))
+
+    async def listener():
+        raise ValueError("boom")
+
+    emitter.on("test", listener)
+
+    async def runner():
+        emitter.emit("test")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    loop.run_until_complete(runner())
+    loop.close()
+    asyncio.set_event_loop(None)
+
+    assert len(contexts) == 1
+    assert isinstance(contexts[0]["exception"], ValueError)
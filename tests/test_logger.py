@@ -0,0 +1,26 @@
+import logging
+
+from py_tmi.logger import Logger
+
+
+def test_is_enabled_for_follows_level():
+    log = Logger("py_tmi.test")
+    assert log.is_enabled_for("error")
+    assert not log.is_enabled_for("info")
+    log.set_level("trace")
+    assert log.is_enabled_for("trace")
+    assert log.is_enabled_for("INFO")
+
+
+def test_get_level_maps_back_to_names():
+    log = Logger("py_tmi.test_levels")
+    for name in ("trace", "debug", "info", "warn", "error", "fatal"):
+        log.set_level(name)
+        assert log.get_level() == name
+
+
+def test_is_enabled_for_follows_stdlib_level():
+    log = Logger("py_tmi.test_stdlib")
+    logging.getLogger("py_tmi.test_stdlib").setLevel(logging.INFO)
+    assert log.is_enabled_for("info")
+    assert not log.is_enabled_for("debug")
@@ -0,0 +1,41 @@
+import asyncio
+
+from py_tmi.message_queue import MessageQueue
+
+
+def test_queue_created_outside_loop_runs_on_running_loop():
+    queue = MessageQueue(0.0)
+    results = []
+
+    async def record(value):
+        results.append(value)
+
+    async def runner():
+        await queue.add_call(record, 1)
+        await queue.add(lambda: record(2))
+        await queue.join()
+        queue.stop()
+
+    asyncio.run(runner())
+
+    assert results == [1, 2]
+
+
+def test_delay_counts_from_callback_start():
+    queue = MessageQueue(0.05)
+    starts = []
+
+    async def slow_send():
+        starts.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(0.04)
+
+    async def runner():
+        for _ in range(3):
+            await queue.add_call(slow_send)
+        await queue.join()
+        queue.stop()
+
+    asyncio.run(runner())
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(0.045 <= gap < 0.085 for gap in gaps)
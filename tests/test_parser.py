@@ -20,3 +20,61 @@ def test_form_tags_roundtrip():
     assert parsed is not None
     for key, value in tags.items():
         assert parsed.tags[key] == value
+
+
+def test_parse_message_interns_tag_keys_and_command():
+    first = parser.parse_message("@msg-id=a;room-id=1 :tmi.twitch.tv NOTICE #chan :x")
+    second = parser.parse_message("@msg-id=b;room-id=2 :tmi.twitch.tv NOTICE #chan :y")
+
+    first_keys = {key: key for key in first.tags}
+    assert all(first_keys[key] is key for key in second.tags)
+    assert first.command is second.command
+
+
+def test_emote_matchers_report_token_spans():
+    message = "Kappa hi xKappa Kappa, :) a:)"
+    regex_hits = {}
+    parser.emote_regex(message, "Kappa", "25", regex_hits)
+    parser.emote_regex(message, ":)", "1", regex_hits)
+    assert regex_hits == {"25": [(0, 4), (16, 21)], "1": [(23, 24), (26, 28)]}
+
+    string_hits = {}
+    parser.emote_string(message, "Kappa", "25", string_hits)
+    parser.emote_string(message, "nope", "0", string_hits)
+    assert string_hits == {"25": [(0, 4)]}
+
+
+def test_emote_patterns_are_cached_per_code_and_mode():
+    parser._emote_pattern.cache_clear()
+    for _ in range(3):
+        parser.emote_regex("Kappa", "Kappa", "25", {})
+        parser.emote_string("Kappa", "Kappa", "25", {})
+    info = parser._emote_pattern.cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
+
+
+def test_parsed_badges_are_not_shared_between_messages():
+    first = parser.parse_badges({"badges": "subscriber/12,premium/1"})
+    second = parser.parse_badges({"badges": "subscriber/12,premium/1"})
+    first["badges"]["vip"] = "1"
+
+    assert second["badges"] == {"subscriber": "12", "premium": "1"}
+    assert parser.parse_emotes({"emotes": "25:0-4,6-10/1902:12-16"})["emotes"] == {
+        "25": ["0-4", "6-10"],
+        "1902": ["12-16"],
+    }
+
+
+def test_emote_scan_matches_emote_string():
+    message = "Kappa hi Kappa <3 Kappa, LUL"
+    emotes = {"25": "Kappa", "9": r"\&lt\;3", "425618": "LUL", "1": "nope"}
+
+    expected = {}
+    for emote_id, code in emotes.items():
+        parser.emote_string(message, code, emote_id, expected)
+    scanned = {}
+    parser.emote_scan(message, emotes, scanned)
+
+    assert scanned == expected
+    assert scanned == {"25": [(0, 4), (9, 13)], "9": [(15, 16)], "425618": [(25, 27)]}
@@ -16,3 +16,73 @@ def test_paginate_message_respects_limit():
     chunks = list(utils.paginate_message(message, limit=50))
     assert all(len(chunk) <= 50 for chunk in chunks)
     assert "word" in chunks[0]
+
+
+def test_channel_normalization_is_cached():
+    utils.channel.cache_clear()
+    assert utils.channel("CachedChan") == "#cachedchan"
+    assert utils.channel("CachedChan") == "#cachedchan"
+    info = utils.channel.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_is_justinfan_is_cached():
+    utils.is_justinfan.cache_clear()
+    assert utils.is_justinfan("justinfan123")
+    assert utils.is_justinfan("justinfan123")
+    assert not utils.is_justinfan(None)
+    assert utils.is_justinfan.cache_info().hits == 1
+
+
+def test_action_text_matches_action_message():
+    for value in ["\x01ACTION waves\x01", "\x01ACTION \x01", "\x01ACTION a\x01b\x01", "hello", "\x01ACTION waves", ""]:
+        match = utils.action_message(value)
+        assert utils.action_text(value) == (match.group(1) if match else None)
+
+
+def test_unescape_html_entities():
+    assert utils.unescape_html(r"\&lt\;3 \&amp\; \&quot\;hi\&quot\; it\&#039\;s \&gt\;") == "<3 & \"hi\" it's >"
+    assert utils.unescape_html(r"\\&amp\;lt\;") == r"\&lt\;"
+    plain = "no entities here"
+    assert utils.unescape_html(plain) is plain
+
+
+def test_token_and_password_strip_oauth_prefix():
+    assert utils.token("OAuth:abc") == "abc"
+    assert utils.token("abcoauth:") == "abcoauth:"
+    assert utils.token(None) == ""
+    assert utils.password("oauth:abc") == "oauth:abc"
+    assert utils.password("abc") == "oauth:abc"
+    assert utils.password("") == ""
+
+
+def test_is_justinfan_requires_digits():
+    assert utils.is_justinfan("justinfan42")
+    assert not utils.is_justinfan("justinfan")
+    assert not utils.is_justinfan("justinfan4x")
+    assert not utils.is_justinfan("xjustinfan42")
+    assert not utils.is_justinfan("")
+
+
+def test_paginate_message_skips_whitespace_between_chunks():
+    assert list(utils.paginate_message("aaaa   bbbb \n cc", limit=5)) == ["aaaa", "bbbb", "cc"]
+    assert list(utils.paginate_message("abcdefgh", limit=3)) == ["abc", "def", "gh"]
+    assert list(utils.paginate_message("", limit=3)) == [""]
+
+
+def test_escape_irc_round_trips_through_unescape():
+    value = "a b;c\\d\ne\rf"
+    escaped = utils.escape_irc(value)
+    assert escaped == "a\\sb\\:c\\\\d\\ne\\rf"
+    assert utils.unescape_irc(escaped) == "a b;c\\def"
+    assert utils.escape_irc("") == ""
+    assert utils.escape_irc(None) is None
+
+
+def test_unescape_irc_pairs_backslashes_left_to_right():
+    assert utils.unescape_irc(r"a\sb\:c\nd\re") == "a b;cde"
+    assert utils.unescape_irc(r"a\\sb") == r"a\sb"
+    assert utils.unescape_irc(r"a\\\sb") == "a\\ b"
+    assert utils.unescape_irc(r"trailing\\") == "trailing\\"
+    assert utils.unescape_irc(r"unknown\q") == r"unknown\q"